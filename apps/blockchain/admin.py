@@ -6,8 +6,22 @@ from .models import BlockchainRecord, SmartContract
 class BlockchainRecordAdmin(admin.ModelAdmin):
     list_display = ['block_number', 'record_type', 'user', 'timestamp']
     list_filter = ['record_type', 'timestamp']
-    search_fields = ['user__username', 'current_hash']
-    readonly_fields = ['block_number', 'current_hash', 'previous_hash']
+    search_fields = ['user__username']
+    readonly_fields = ['block_number', 'current_hash', 'previous_hash', 'record_data']
+    
+    def get_search_results(self, request, queryset, search_term):
+        queryset, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        
+        # Hashes are stored as raw bytes, so only a complete hex digest can match
+        term = search_term.strip().lower()
+        if len(term) == 64:
+            try:
+                bytes.fromhex(term)
+            except ValueError:
+                pass
+            else:
+                queryset |= self.model.objects.filter(current_hash=term)
+        return queryset, may_have_duplicates
 
 
 @admin.register(SmartContract)
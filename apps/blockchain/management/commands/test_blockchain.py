@@ -2,6 +2,7 @@
 Management command to test blockchain integrity and tamper detection
 """
 from django.core.management.base import BaseCommand
+from django.db.models import Count, Max, Min
 from django.utils import timezone
 from apps.blockchain.models import BlockchainRecord
 from apps.blockchain.utils import BlockchainManager
@@ -61,61 +62,74 @@ class Command(BaseCommand):
 
     def show_statistics(self):
         """Display blockchain statistics"""
-        total_blocks = BlockchainRecord.objects.count()
+        bounds = BlockchainRecord.objects.aggregate(
+            total=Count('id'), first=Min('block_number'), last=Max('block_number')
+        )
+        total_blocks = bounds['total']
         
         self.stdout.write(self.style.HTTP_INFO(f'\n📊 Blockchain Statistics:'))
         self.stdout.write(f'  Total Blocks: {total_blocks}')
         
         if total_blocks > 0:
-            first_block = BlockchainRecord.objects.order_by('block_number').first()
-            last_block = BlockchainRecord.objects.order_by('-block_number').first()
+            # Fetch both ends of the chain in one indexed query
+            ends = BlockchainRecord.objects.only('block_number', 'timestamp').in_bulk(
+                [bounds['first'], bounds['last']], field_name='block_number'
+            )
+            first_block = ends[bounds['first']]
+            last_block = ends[bounds['last']]
             
             self.stdout.write(f'  First Block: #{first_block.block_number} ({first_block.timestamp})')
             self.stdout.write(f'  Last Block: #{last_block.block_number} ({last_block.timestamp})')
             
             # Count by type
             self.stdout.write(f'\n  Records by Type:')
+            counts = dict(
+                BlockchainRecord.objects.order_by()
+                .values_list('record_type')
+                .annotate(count=Count('id'))
+            )
             for choice in BlockchainRecord.RECORD_TYPE_CHOICES:
-                count = BlockchainRecord.objects.filter(record_type=choice[0]).count()
+                count = counts.get(choice[0], 0)
                 if count > 0:
                     self.stdout.write(f'    - {choice[1]}: {count}')
 
     def create_test_records(self):
         """Create test blockchain records"""
         # Test with existing users and presentations
-        users = CustomUser.objects.all()[:3]
-        presentations = PresentationRequest.objects.all()[:3]
+        users = list(CustomUser.objects.all()[:3])
+        presentations = list(PresentationRequest.objects.select_related('student')[:3])
         
-        if not users.exists():
+        if not users:
             self.stdout.write(self.style.WARNING('  No users found to create test records'))
             return
         
-        created_count = 0
-        
-        # Create some test records
-        for user in users:
-            BlockchainManager.record_operation(
+        # Build all entries first, then chain and insert them in one go
+        entries = [
+            BlockchainManager.build_entry(
                 record_type='user_update',
                 model_instance=user,
                 operation='update',
                 user=user
             )
-            created_count += 1
-        
-        for presentation in presentations:
-            BlockchainManager.record_operation(
+            for user in users
+        ]
+        entries += [
+            BlockchainManager.build_entry(
                 record_type='presentation_submission',
                 model_instance=presentation,
                 operation='update',
                 user=presentation.student
             )
-            created_count += 1
+            for presentation in presentations
+        ]
+        
+        created_count = len(BlockchainRecord.append_blocks(entries))
         
         self.stdout.write(self.style.SUCCESS(f'  ✓ Created {created_count} test records'))
 
     def verify_integrity(self):
         """Verify blockchain integrity"""
-        is_valid, errors = BlockchainManager.verify_chain_integrity()
+        is_valid, errors, _ = BlockchainManager.verify_chain_integrity()
         
         if is_valid:
             self.stdout.write(self.style.SUCCESS('  ✓ Blockchain integrity verified: VALID'))
@@ -129,19 +143,23 @@ class Command(BaseCommand):
 
     def simulate_tampering(self):
         """Simulate tampering with blockchain data"""
-        # Get a random block (not the genesis block)
-        blocks = BlockchainRecord.objects.filter(block_number__gt=1)
+        # Get a random block (not the genesis block) without loading the whole chain
+        max_block_number = BlockchainRecord.objects.aggregate(m=Max('block_number'))['m']
         
-        if not blocks.exists():
+        if not max_block_number or max_block_number < 2:
             self.stdout.write(self.style.WARNING('  Not enough blocks to simulate tampering'))
             return
         
-        tampered_block = random.choice(blocks)
-        original_data = tampered_block.record_data.copy()
+        target = random.randint(2, max_block_number)
+        tampered_block = BlockchainRecord.objects.filter(
+            block_number__gte=target
+        ).order_by('block_number').first()
+        record_data = tampered_block.record_data
         
         # Tamper with the data
-        tampered_block.record_data['TAMPERED'] = True
-        tampered_block.record_data['original_operation'] = original_data.get('operation')
+        record_data['TAMPERED'] = True
+        record_data['original_operation'] = record_data.get('operation')
+        tampered_block.record_data = record_data
         tampered_block.save()
         
         self.stdout.write(self.style.ERROR(f'  ⚠️  Tampered with Block #{tampered_block.block_number}'))
@@ -0,0 +1,30 @@
+"""
+Middleware for batching blockchain writes per request
+"""
+import logging
+from django.utils.deprecation import MiddlewareMixin
+from apps.blockchain.utils import BlockchainManager
+
+logger = logging.getLogger(__name__)
+
+
+class BlockchainBatchMiddleware(MiddlewareMixin):
+    """
+    Collect the blockchain operations emitted by model signals during a request
+    and append them to the chain together once the response is ready, instead of
+    appending one block per saved object.
+    """
+    
+    def process_request(self, request):
+        """Start a fresh batch for this request"""
+        BlockchainManager.start_batch()
+        return None
+    
+    def process_response(self, request, response):
+        """Write the batched operations as consecutive blocks"""
+        try:
+            BlockchainManager.flush_batch()
+        except Exception:
+            # Don't let blockchain recording break the request
+            logger.exception('Failed to write batched blockchain records')
+        return response
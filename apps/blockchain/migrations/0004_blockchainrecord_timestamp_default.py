@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:50
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="timestamp",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0004_blockchainrecord_timestamp_default"),
+    ]
+
+    operations = [
+        # Existing blocks were hashed from json.dumps output (version 1)
+        migrations.AddField(
+            model_name="blockchainrecord",
+            name="hash_version",
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="hash_version",
+            field=models.PositiveSmallIntegerField(default=2, editable=False),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:54
+
+from django.db import migrations, models
+
+
+def backfill_audit_lookup(apps, schema_editor):
+    """Copy record_data['model'] / ['model_id'] of existing blocks into the lookup columns"""
+    BlockchainRecord = apps.get_model("blockchain", "BlockchainRecord")
+    batch = []
+    for block in BlockchainRecord.objects.only("id", "record_data").iterator(
+        chunk_size=2000
+    ):
+        record_data = block.record_data if isinstance(block.record_data, dict) else {}
+        block.target_model = record_data.get("model", "")
+        block.target_id = record_data.get("model_id", "")
+        batch.append(block)
+        if len(batch) >= 2000:
+            BlockchainRecord.objects.bulk_update(batch, ["target_model", "target_id"])
+            batch = []
+    if batch:
+        BlockchainRecord.objects.bulk_update(batch, ["target_model", "target_id"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0005_blockchainrecord_hash_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blockchainrecord",
+            name="target_id",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="blockchainrecord",
+            name="target_model",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.RunPython(backfill_audit_lookup, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="blockchainrecord",
+            index=models.Index(
+                fields=["target_model", "target_id", "block_number"],
+                name="br_audit_lookup",
+            ),
+        ),
+    ]
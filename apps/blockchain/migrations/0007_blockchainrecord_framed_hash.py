@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0006_blockchainrecord_audit_lookup"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="hash_version",
+            field=models.PositiveSmallIntegerField(default=3, editable=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:58
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0007_blockchainrecord_framed_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IntegrityWatermark",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("block_number", models.BigIntegerField(default=0)),
+                ("block_hash", models.CharField(blank=True, max_length=256)),
+                ("verified_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "blockchain_integrity_watermark",
+            },
+        ),
+    ]
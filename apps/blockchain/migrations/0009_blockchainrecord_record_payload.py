@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:55
+
+from django.db import migrations, models
+import orjson
+
+
+def encode_record_data(apps, schema_editor):
+    """Store each block's JSON record_data as sorted-key orjson bytes"""
+    BlockchainRecord = apps.get_model("blockchain", "BlockchainRecord")
+    batch = []
+    for block in BlockchainRecord.objects.only("id", "record_data").iterator(
+        chunk_size=2000
+    ):
+        block.record_payload = orjson.dumps(
+            block.record_data, option=orjson.OPT_SORT_KEYS
+        )
+        batch.append(block)
+        if len(batch) >= 2000:
+            BlockchainRecord.objects.bulk_update(batch, ["record_payload"])
+            batch = []
+    if batch:
+        BlockchainRecord.objects.bulk_update(batch, ["record_payload"])
+
+
+def decode_record_data(apps, schema_editor):
+    """Restore record_data from the encoded payload"""
+    BlockchainRecord = apps.get_model("blockchain", "BlockchainRecord")
+    batch = []
+    for block in BlockchainRecord.objects.only("id", "record_payload").iterator(
+        chunk_size=2000
+    ):
+        block.record_data = orjson.loads(bytes(block.record_payload))
+        batch.append(block)
+        if len(batch) >= 2000:
+            BlockchainRecord.objects.bulk_update(batch, ["record_data"])
+            batch = []
+    if batch:
+        BlockchainRecord.objects.bulk_update(batch, ["record_data"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0008_integritywatermark"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blockchainrecord",
+            name="record_payload",
+            field=models.BinaryField(default=b""),
+            preserve_default=False,
+        ),
+        # Let the column be dropped and, when reversing, re-added to existing rows
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="record_data",
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(encode_record_data, decode_record_data),
+        migrations.RemoveField(
+            model_name="blockchainrecord",
+            name="record_data",
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:04
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0009_blockchainrecord_record_payload"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MerkleCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("epoch", models.BigIntegerField(unique=True)),
+                ("block_start", models.BigIntegerField()),
+                ("block_end", models.BigIntegerField()),
+                ("root", models.CharField(max_length=64)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "blockchain_merkle_checkpoints",
+                "ordering": ["epoch"],
+            },
+        ),
+    ]
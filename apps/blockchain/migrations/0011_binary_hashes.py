@@ -0,0 +1,122 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:10
+
+import apps.blockchain.models
+from django.db import migrations, models
+
+# (model, hash fields) converted by this migration
+HASH_FIELDS = [
+    ("BlockchainRecord", ["previous_hash", "current_hash"]),
+    ("SmartContract", ["contract_hash"]),
+]
+
+
+def copy_hashes(apps, source_suffix, target_suffix):
+    for model_name, fields in HASH_FIELDS:
+        model = apps.get_model("blockchain", model_name)
+        sources = [field + source_suffix for field in fields]
+        targets = [field + target_suffix for field in fields]
+        batch = []
+        for obj in model.objects.only("id", *sources).iterator(chunk_size=2000):
+            # Sha256Field takes and returns hex, so the values copy across unchanged
+            for source, target in zip(sources, targets):
+                setattr(obj, target, getattr(obj, source))
+            batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, targets)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, targets)
+
+
+def hex_to_binary(apps, schema_editor):
+    """Copy the hex hashes into the binary columns"""
+    copy_hashes(apps, "", "_bin")
+
+
+def binary_to_hex(apps, schema_editor):
+    """Copy the binary hashes back into the hex columns"""
+    copy_hashes(apps, "_bin", "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0010_merklecheckpoint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blockchainrecord",
+            name="previous_hash_bin",
+            field=apps.blockchain.models.Sha256Field(null=True),
+        ),
+        migrations.AddField(
+            model_name="blockchainrecord",
+            name="current_hash_bin",
+            field=apps.blockchain.models.Sha256Field(null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name="smartcontract",
+            name="contract_hash_bin",
+            field=apps.blockchain.models.Sha256Field(null=True, unique=True),
+        ),
+        # Let the hex columns be dropped and, when reversing, re-added to existing rows
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="previous_hash",
+            field=models.CharField(max_length=256, null=True),
+        ),
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="current_hash",
+            field=models.CharField(max_length=256, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="smartcontract",
+            name="contract_hash",
+            field=models.CharField(max_length=256, null=True, unique=True),
+        ),
+        migrations.RunPython(hex_to_binary, binary_to_hex),
+        migrations.RemoveField(
+            model_name="blockchainrecord",
+            name="previous_hash",
+        ),
+        migrations.RemoveField(
+            model_name="blockchainrecord",
+            name="current_hash",
+        ),
+        migrations.RemoveField(
+            model_name="smartcontract",
+            name="contract_hash",
+        ),
+        migrations.RenameField(
+            model_name="blockchainrecord",
+            old_name="previous_hash_bin",
+            new_name="previous_hash",
+        ),
+        migrations.RenameField(
+            model_name="blockchainrecord",
+            old_name="current_hash_bin",
+            new_name="current_hash",
+        ),
+        migrations.RenameField(
+            model_name="smartcontract",
+            old_name="contract_hash_bin",
+            new_name="contract_hash",
+        ),
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="previous_hash",
+            field=apps.blockchain.models.Sha256Field(),
+        ),
+        migrations.AlterField(
+            model_name="blockchainrecord",
+            name="current_hash",
+            field=apps.blockchain.models.Sha256Field(unique=True),
+        ),
+        migrations.AlterField(
+            model_name="smartcontract",
+            name="contract_hash",
+            field=apps.blockchain.models.Sha256Field(unique=True),
+        ),
+    ]
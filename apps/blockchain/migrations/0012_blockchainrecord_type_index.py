@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blockchain", "0011_binary_hashes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blockchainrecord",
+            index=models.Index(
+                fields=["record_type", "-block_number"], name="br_type_bn_desc"
+            ),
+        ),
+    ]
@@ -1,11 +1,79 @@
 import uuid
 
-from django.db import models
+from django.core.cache import cache
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
 import hashlib
 import json
+import orjson
+import struct
 from datetime import datetime
 
 
+# previous_hash of the genesis block
+GENESIS_PREVIOUS_HASH = "0" * 64
+
+# Hash input encodings; each block stores the version it was hashed with
+HASH_VERSION_JSON = 1    # json.dumps(sort_keys=True), used by the original blocks
+HASH_VERSION_ORJSON = 2  # orjson.dumps(OPT_SORT_KEYS), compact UTF-8 output
+HASH_VERSION_FRAMED = 3  # length-prefixed canonical bytes, see _framed_hash_input
+CURRENT_HASH_VERSION = HASH_VERSION_FRAMED
+
+# Number of consecutive blocks covered by one MerkleCheckpoint
+MERKLE_EPOCH_SIZE = 1024
+
+# Cache entry holding (block_number, current_hash) of the committed chain tip
+_LAST_BLOCK_CACHE_KEY = 'blockchain:last_block'
+# Attempts made to append a block when a concurrent writer claims the same number
+_APPEND_ATTEMPTS = 3
+
+
+class Sha256Field(models.BinaryField):
+    """
+    SHA-256 digest stored as its 32 raw bytes (binary(32) on MySQL) and handled
+    as a 64 character hex string in Python
+    """
+    
+    def __init__(self, *args, **kwargs):
+        kwargs['max_length'] = 32
+        super().__init__(*args, **kwargs)
+    
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        del kwargs['max_length']
+        return name, path, args, kwargs
+    
+    def db_type(self, connection):
+        # longblob cannot carry a unique index on MySQL, a fixed-size binary can
+        if connection.vendor == 'mysql':
+            return 'binary(32)'
+        return super().db_type(connection)
+    
+    def get_default(self):
+        default = super().get_default()
+        return default.hex() if isinstance(default, bytes) else default
+    
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if isinstance(value, str):
+            # Raises ValueError for anything that is not a hex digest
+            return bytes.fromhex(value)
+        return value
+    
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return bytes(value).hex()
+    
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return bytes(value).hex()
+        return value
+    
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+
 class BlockchainRecord(models.Model):
     """Model to store blockchain records for tamper-proof data"""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -25,12 +93,19 @@ class BlockchainRecord(models.Model):
     
     # Block information
     block_number = models.BigIntegerField(unique=True)
-    previous_hash = models.CharField(max_length=256)
-    current_hash = models.CharField(max_length=256, unique=True)
+    previous_hash = Sha256Field()
+    current_hash = Sha256Field(unique=True)
+    hash_version = models.PositiveSmallIntegerField(default=CURRENT_HASH_VERSION, editable=False)
     
     # Record details
     record_type = models.CharField(max_length=50, choices=RECORD_TYPE_CHOICES)
-    record_data = models.JSONField()  # Serialized data
+    # Serialized data as sorted-key orjson bytes, exposed as a dict through record_data.
+    # These are the exact bytes framed into the version 3 hash input.
+    record_payload = models.BinaryField()
+    
+    # Recorded object, copied from record_data['model'] / ['model_id'] for indexed audit lookups
+    target_model = models.CharField(max_length=100, blank=True, default='')
+    target_id = models.CharField(max_length=64, blank=True, default='')
     
     # Associated objects
     user = models.ForeignKey(
@@ -48,27 +123,59 @@ class BlockchainRecord(models.Model):
         related_name='blockchain_records'
     )
     
-    # Metadata
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Metadata (set explicitly in create_block so it can be hashed before the insert)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     
     class Meta:
         db_table = 'blockchain_records'
         ordering = ['block_number']
+        indexes = [
+            models.Index(fields=['target_model', 'target_id', 'block_number'], name='br_audit_lookup'),
+            # Per-type counts and latest-by-type listings; also serves record_type filters
+            models.Index(fields=['record_type', '-block_number'], name='br_type_bn_desc'),
+        ]
     
     def __str__(self):
         return f"Block #{self.block_number} - {self.record_type}"
     
+    @property
+    def record_data(self):
+        """Recorded data decoded from record_payload (a fresh dict on every access)"""
+        return orjson.loads(bytes(self.record_payload))
+    
+    @record_data.setter
+    def record_data(self, value):
+        self.record_payload = encode_record_data(value)
+    
     @staticmethod
-    def calculate_hash(block_number, previous_hash, data, timestamp):
-        """Calculate SHA-256 hash for a block"""
-        block_string = json.dumps({
+    def calculate_hash(block_number, previous_hash, data, timestamp, version=CURRENT_HASH_VERSION):
+        """
+        Calculate SHA-256 hash for a block using the given hash input version
+        
+        data is either the record data dict or its encoded record_payload bytes.
+        """
+        if version == HASH_VERSION_FRAMED:
+            if isinstance(data, (bytes, memoryview)):
+                payload = bytes(data)
+            else:
+                payload = encode_record_data(data)
+            return hashlib.sha256(_framed_hash_input(block_number, previous_hash, payload, timestamp)).hexdigest()
+        
+        if isinstance(data, (bytes, memoryview)):
+            data = orjson.loads(bytes(data))
+        block = {
             'block_number': block_number,
             'previous_hash': previous_hash,
             'data': data,
             'timestamp': str(timestamp)
-        }, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        }
+        if version == HASH_VERSION_JSON:
+            # json.dumps escapes non-ASCII by default, so the ASCII codec is exact here
+            block_bytes = json.dumps(block, sort_keys=True).encode('ascii')
+        else:
+            block_bytes = orjson.dumps(block, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(block_bytes).hexdigest()
     
     @classmethod
     def get_last_block(cls):
@@ -79,40 +186,161 @@ class BlockchainRecord(models.Model):
             return None
     
     @classmethod
-    def create_block(cls, record_type, record_data, user=None, presentation=None, ip_address=None):
-        """Create a new block in the blockchain"""
-        from django.utils import timezone as tz
+    def get_chain_tip(cls):
+        """
+        Get (block_number, current_hash) of the last block, or None for an empty chain.
         
-        last_block = cls.get_last_block()
+        The tip is served from the cache when possible. It is only ever written to the
+        cache after a commit, so a cached tip can lag behind the database but never run
+        ahead of it; a lagging tip is caught by the unique block_number on insert.
         
-        # Determine next block number and previous hash
-        if last_block:
-            block_number = last_block.block_number + 1
-            previous_hash = last_block.current_hash
-        else:
-            block_number = 1
-            previous_hash = "0" * 64  # Genesis block
-        
-        # Create block first to get the actual timestamp
-        block = cls.objects.create(
-            block_number=block_number,
-            previous_hash=previous_hash,
-            current_hash="temporary",  # Temporary placeholder
-            record_type=record_type,
-            record_data=record_data,
-            user=user,
-            presentation=presentation,
-            ip_address=ip_address
-        )
+        This needs the shared cache configured in CACHES: a per-process cache would
+        lag behind every block appended by another process.
+        """
+        tip = cache.get(_LAST_BLOCK_CACHE_KEY)
+        if tip is None:
+            last_block = cls.get_last_block()
+            if last_block:
+                tip = (last_block.block_number, last_block.current_hash)
+                transaction.on_commit(lambda: cache.set(_LAST_BLOCK_CACHE_KEY, tip))
+        return tip
+    
+    @classmethod
+    def create_block(cls, record_type, record_data, user=None, presentation=None, ip_address=None):
+        """Create a new block in the blockchain"""
+        return cls.append_blocks([{
+            'record_type': record_type,
+            'record_data': record_data,
+            'user_id': user.pk if user else None,
+            'presentation_id': presentation.pk if presentation else None,
+            'ip_address': ip_address,
+        }])[0]
+    
+    @classmethod
+    def append_blocks(cls, entries):
+        """
+        Append several blocks to the chain with one tip lookup and one bulk INSERT.
         
-        # Now calculate hash with the actual timestamp
-        current_hash = cls.calculate_hash(block_number, previous_hash, record_data, block.timestamp)
+        Args:
+            entries: list of dicts with record_type, record_data, user_id,
+                presentation_id and ip_address keys
         
-        # Update with correct hash
-        block.current_hash = current_hash
-        block.save(update_fields=['current_hash'])
+        Returns the created blocks in chain order.
+        """
+        if not entries:
+            return []
         
-        return block
+        for attempt in range(_APPEND_ATTEMPTS):
+            tip = cls.get_chain_tip()
+            
+            # Determine next block number and previous hash
+            if tip:
+                block_number, previous_hash = tip
+            else:
+                block_number = 0
+                previous_hash = GENESIS_PREVIOUS_HASH
+            
+            # Chain the blocks in memory; every hash is known before the INSERT
+            blocks = []
+            for entry in entries:
+                record_data = entry['record_data']
+                record_payload = encode_record_data(record_data)
+                block_number += 1
+                timestamp = timezone.now()
+                current_hash = cls.calculate_hash(block_number, previous_hash, record_payload, timestamp)
+                blocks.append(cls(
+                    block_number=block_number,
+                    previous_hash=previous_hash,
+                    current_hash=current_hash,
+                    record_type=entry['record_type'],
+                    record_payload=record_payload,
+                    target_model=record_data.get('model', ''),
+                    target_id=record_data.get('model_id', ''),
+                    user_id=entry.get('user_id'),
+                    presentation_id=entry.get('presentation_id'),
+                    ip_address=entry.get('ip_address'),
+                    timestamp=timestamp,
+                    hash_version=CURRENT_HASH_VERSION
+                ))
+                previous_hash = current_hash
+            
+            try:
+                with transaction.atomic():
+                    cls.objects.bulk_create(blocks)
+            except IntegrityError:
+                # Stale tip: another writer already appended this block number
+                cache.delete(_LAST_BLOCK_CACHE_KEY)
+                if attempt == _APPEND_ATTEMPTS - 1:
+                    raise
+                continue
+            
+            new_tip = (block_number, previous_hash)
+            transaction.on_commit(lambda: cache.set(_LAST_BLOCK_CACHE_KEY, new_tip))
+            return blocks
+
+
+class IntegrityWatermark(models.Model):
+    """Last block up to which the chain has been verified (singleton)"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    
+    block_number = models.BigIntegerField(default=0)
+    block_hash = models.CharField(max_length=256, blank=True)
+    verified_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'blockchain_integrity_watermark'
+    
+    def __str__(self):
+        return f"Verified up to block #{self.block_number}"
+    
+    @classmethod
+    def get_watermark(cls):
+        """Get or create the watermark instance (singleton pattern)"""
+        watermark = cls.objects.first()
+        if watermark is None:
+            watermark = cls.objects.create()
+        return watermark
+
+
+class MerkleCheckpoint(models.Model):
+    """Merkle root over the current_hash values of one epoch of verified blocks"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    
+    epoch = models.BigIntegerField(unique=True)
+    block_start = models.BigIntegerField()
+    block_end = models.BigIntegerField()
+    root = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'blockchain_merkle_checkpoints'
+        ordering = ['epoch']
+    
+    def __str__(self):
+        return f"Checkpoint #{self.epoch} (blocks {self.block_start}-{self.block_end})"
+
+
+def encode_record_data(data):
+    """Encode record data canonically: orjson with sorted keys"""
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+
+def _framed_hash_input(block_number, previous_hash, payload, timestamp):
+    """
+    Build the version 3 hash input: the block number as 8 big-endian bytes followed
+    by the raw previous hash digest, the ISO 8601 timestamp and the encoded record
+    data (see encode_record_data), each prefixed with its 4-byte big-endian length.
+    
+    Raises ValueError if previous_hash is not a hex digest.
+    """
+    parts = (
+        bytes.fromhex(previous_hash),
+        timestamp.isoformat().encode('ascii'),
+        payload,
+    )
+    return struct.pack('>Q', block_number) + b''.join(
+        struct.pack('>I', len(part)) + part for part in parts
+    )
 
 
 class SmartContract(models.Model):
@@ -128,7 +356,7 @@ class SmartContract(models.Model):
     name = models.CharField(max_length=255)
     contract_type = models.CharField(max_length=50, choices=CONTRACT_TYPE_CHOICES)
     contract_code = models.TextField()  # Python code as string
-    contract_hash = models.CharField(max_length=256, unique=True)
+    contract_hash = Sha256Field(unique=True)
     
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -141,10 +369,26 @@ class SmartContract(models.Model):
     def __str__(self):
         return self.name
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Code the stored contract_hash was computed from; read from __dict__ so a
+        # deferred contract_code is not fetched just for this
+        self._hashed_code = self.__dict__.get('contract_code') if self.contract_hash else None
+    
     def calculate_hash(self):
         """Calculate hash of contract code"""
         return hashlib.sha256(self.contract_code.encode()).hexdigest()
     
     def save(self, *args, **kwargs):
-        self.contract_hash = self.calculate_hash()
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        writes_code = update_fields is None or 'contract_code' in update_fields
+        
+        # Only rehash when the code being written differs from the hashed code
+        if writes_code and (not self.contract_hash or self.contract_code != self._hashed_code):
+            self.contract_hash = self.calculate_hash()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'contract_hash'}
+            super().save(*args, **kwargs)
+            self._hashed_code = self.contract_code
+        else:
+            super().save(*args, **kwargs)
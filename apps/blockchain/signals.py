@@ -17,14 +17,14 @@ from apps.blockchain.utils import BlockchainManager
 def record_user_blockchain(sender, instance, created, **kwargs):
     """Record user creation/update in blockchain"""
     if created:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='user_creation',
             model_instance=instance,
             operation='create',
             user=instance
         )
     else:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='user_update',
             model_instance=instance,
             operation='update',
@@ -37,14 +37,14 @@ def record_user_blockchain(sender, instance, created, **kwargs):
 def record_user_group_blockchain(sender, instance, created, **kwargs):
     """Record user group/role creation/update in blockchain"""
     if created:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='role_creation',
             model_instance=instance,
             operation='create',
             user=None
         )
     else:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='role_update',
             model_instance=instance,
             operation='update',
@@ -55,7 +55,7 @@ def record_user_group_blockchain(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=UserGroup)
 def record_user_group_deletion_blockchain(sender, instance, **kwargs):
     """Record user group/role deletion in blockchain"""
-    BlockchainManager.record_operation(
+    BlockchainManager.queue_operation(
         record_type='role_deletion',
         model_instance=instance,
         operation='delete',
@@ -68,7 +68,7 @@ def record_user_group_deletion_blockchain(sender, instance, **kwargs):
 def record_presentation_blockchain(sender, instance, created, **kwargs):
     """Record presentation submission/update in blockchain"""
     if created:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='presentation_submission',
             model_instance=instance,
             operation='create',
@@ -77,7 +77,7 @@ def record_presentation_blockchain(sender, instance, created, **kwargs):
     else:
         # Check if scheduled_date changed
         if instance.scheduled_date:
-            BlockchainManager.record_operation(
+            BlockchainManager.queue_operation(
                 record_type='presentation_scheduled',
                 model_instance=instance,
                 operation='update',
@@ -89,7 +89,7 @@ def record_presentation_blockchain(sender, instance, created, **kwargs):
 def record_assignment_blockchain(sender, instance, created, **kwargs):
     """Record presentation assignment in blockchain"""
     if created:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='presentation_scheduled',
             model_instance=instance,
             operation='create',
@@ -101,7 +101,7 @@ def record_assignment_blockchain(sender, instance, created, **kwargs):
 def record_examiner_assignment_blockchain(sender, instance, created, **kwargs):
     """Record examiner assignment in blockchain"""
     if created or instance.status in ['accepted', 'declined']:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='assessment_submitted',
             model_instance=instance,
             operation='create' if created else 'update',
@@ -114,7 +114,7 @@ def record_examiner_assignment_blockchain(sender, instance, created, **kwargs):
 def record_notification_blockchain(sender, instance, created, **kwargs):
     """Record notification sending in blockchain"""
     if created:
-        BlockchainManager.record_operation(
+        BlockchainManager.queue_operation(
             record_type='notification_sent',
             model_instance=instance,
             operation='create',
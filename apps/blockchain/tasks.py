@@ -0,0 +1,26 @@
+import logging
+
+from celery import shared_task
+from django.db import IntegrityError
+
+from apps.blockchain.models import BlockchainRecord
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=5)
+def record_blocks(self, entries):
+    """
+    Append blockchain entries queued by BlockchainManager.dispatch_entries.
+
+    Entries are snapshotted when the object is saved, so the block records the
+    state that was committed rather than whatever the row holds when the worker
+    picks the task up. Losing a race for the chain tip repeatedly is retried.
+    """
+    try:
+        blocks = BlockchainRecord.append_blocks(entries)
+    except IntegrityError as exc:
+        logger.warning('Blockchain append contended, retrying %d entries', len(entries))
+        raise self.retry(exc=exc, countdown=1)
+
+    return f'Appended {len(blocks)} block(s)'
@@ -0,0 +1,91 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.blockchain.models import BlockchainRecord, IntegrityWatermark, encode_record_data
+from apps.blockchain.utils import BlockchainManager
+
+
+def _entries(count, start=0):
+    return [
+        {
+            'record_type': 'user_update',
+            'record_data': {'model': 'CustomUser', 'model_id': str(start + i), 'operation': 'update', 'data': {}},
+            'user_id': None,
+            'presentation_id': None,
+            'ip_address': None,
+        }
+        for i in range(count)
+    ]
+
+
+class ChainIntegrityTests(TestCase):
+    def setUp(self):
+        # The chain tip is cached across tests; start every test from an empty chain
+        cache.clear()
+        BlockchainRecord.append_blocks(_entries(10))
+
+    def tamper_payload(self, block_number):
+        BlockchainRecord.objects.filter(block_number=block_number).update(
+            record_payload=encode_record_data({'model': 'CustomUser', 'model_id': 'forged'})
+        )
+
+    def test_full_check_passes_on_untouched_chain(self):
+        is_valid, errors, verified_range = BlockchainManager.verify_chain_integrity()
+
+        self.assertTrue(is_valid, errors)
+        self.assertEqual(verified_range, (1, 10))
+        self.assertEqual(IntegrityWatermark.get_watermark().block_number, 10)
+
+    def test_default_check_catches_payload_tampered_below_watermark(self):
+        BlockchainManager.verify_chain_integrity()
+        self.tamper_payload(2)
+
+        is_valid, errors, verified_range = BlockchainManager.verify_chain_integrity()
+
+        self.assertFalse(is_valid)
+        self.assertIn('Block #2: Hash verification failed', errors)
+        self.assertEqual(verified_range, (1, 10))
+
+    def test_default_check_catches_hash_rewritten_below_watermark(self):
+        BlockchainManager.verify_chain_integrity()
+        BlockchainRecord.objects.filter(block_number=5).update(current_hash='ab' * 32)
+
+        is_valid, errors, _ = BlockchainManager.verify_chain_integrity()
+
+        self.assertFalse(is_valid)
+        self.assertIn('Block #5: Hash verification failed', errors)
+        self.assertIn('Block #6: Previous hash mismatch', errors)
+
+    def test_incremental_check_reports_only_the_blocks_it_checked(self):
+        BlockchainManager.verify_chain_integrity()
+        self.tamper_payload(2)
+        BlockchainRecord.append_blocks(_entries(3, start=10))
+
+        is_valid, errors, verified_range = BlockchainManager.verify_chain_integrity(full=False)
+
+        # Block 2 is below the watermark, so the incremental check does not cover it
+        self.assertTrue(is_valid, errors)
+        self.assertEqual(verified_range, (11, 13))
+
+    def test_incremental_check_catches_tampering_above_watermark(self):
+        BlockchainManager.verify_chain_integrity()
+        BlockchainRecord.append_blocks(_entries(3, start=10))
+        self.tamper_payload(12)
+
+        is_valid, errors, verified_range = BlockchainManager.verify_chain_integrity(full=False)
+
+        self.assertFalse(is_valid)
+        self.assertIn('Block #12: Hash verification failed', errors)
+        self.assertEqual(verified_range, (11, 13))
+        # A failed check sends the next incremental check back to the genesis block
+        self.assertEqual(IntegrityWatermark.get_watermark().block_number, 0)
+
+    def test_incremental_check_rescans_when_watermark_block_changed(self):
+        BlockchainManager.verify_chain_integrity()
+        BlockchainRecord.objects.filter(block_number=10).update(current_hash='cd' * 32)
+
+        is_valid, errors, verified_range = BlockchainManager.verify_chain_integrity(full=False)
+
+        self.assertFalse(is_valid)
+        self.assertIn('Block #10: Differs from the last verified chain', errors)
+        self.assertEqual(verified_range, (1, 10))
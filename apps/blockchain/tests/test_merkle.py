@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.blockchain.models import BlockchainRecord, MerkleCheckpoint, MERKLE_EPOCH_SIZE
+from apps.blockchain.utils import BlockchainManager, compute_merkle_root
+
+
+def _entries(count):
+    return [
+        {
+            'record_type': 'user_update',
+            'record_data': {'model': 'CustomUser', 'model_id': str(i), 'operation': 'update', 'data': {}},
+            'user_id': None,
+            'presentation_id': None,
+            'ip_address': None,
+        }
+        for i in range(count)
+    ]
+
+
+class MerkleCheckpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # One complete epoch plus a few blocks of the next one
+        BlockchainRecord.append_blocks(_entries(MERKLE_EPOCH_SIZE + 5))
+
+    def epoch_hashes(self):
+        return list(
+            BlockchainRecord.objects.filter(block_number__lte=MERKLE_EPOCH_SIZE)
+            .order_by('block_number')
+            .values_list('current_hash', flat=True)
+        )
+
+    def test_verification_checkpoints_complete_epochs_only(self):
+        BlockchainManager.verify_chain_integrity()
+
+        checkpoint = MerkleCheckpoint.objects.get()
+        self.assertEqual((checkpoint.epoch, checkpoint.block_start, checkpoint.block_end), (0, 1, MERKLE_EPOCH_SIZE))
+        self.assertEqual(checkpoint.root, compute_merkle_root(self.epoch_hashes()))
+
+    def test_missing_checkpoint_is_rebuilt(self):
+        BlockchainManager.verify_chain_integrity()
+        root = MerkleCheckpoint.objects.get().root
+        MerkleCheckpoint.objects.all().delete()
+
+        created = BlockchainManager.build_merkle_checkpoints(MERKLE_EPOCH_SIZE + 5)
+
+        self.assertEqual(created, 1)
+        self.assertEqual(MerkleCheckpoint.objects.get().root, root)
+        # Existing checkpoints are left alone
+        self.assertEqual(BlockchainManager.build_merkle_checkpoints(MERKLE_EPOCH_SIZE + 5), 0)
+
+    def test_epoch_with_a_gap_gets_no_checkpoint(self):
+        BlockchainRecord.objects.filter(block_number=7).delete()
+
+        self.assertEqual(BlockchainManager.build_merkle_checkpoints(MERKLE_EPOCH_SIZE + 5), 0)
+        self.assertFalse(MerkleCheckpoint.objects.exists())
+
+    def test_sampled_check_passes_on_untouched_chain(self):
+        BlockchainManager.verify_chain_integrity()
+
+        is_valid, errors, sampled = BlockchainManager.verify_chain_integrity_sampled(5)
+
+        self.assertTrue(is_valid, errors)
+        self.assertTrue(sampled)
+        self.assertTrue(all(1 <= number <= MERKLE_EPOCH_SIZE for number in sampled))
+
+    def test_sampled_check_catches_rewritten_hash_in_checkpointed_epoch(self):
+        BlockchainManager.verify_chain_integrity()
+        BlockchainRecord.objects.filter(block_number=100).update(current_hash='ab' * 32)
+
+        is_valid, errors, _ = BlockchainManager.verify_chain_integrity_sampled(1)
+
+        self.assertFalse(is_valid)
+        self.assertIn(f'Blocks #1-#{MERKLE_EPOCH_SIZE}: Merkle root mismatch', errors)
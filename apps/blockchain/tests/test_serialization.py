@@ -0,0 +1,36 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.blockchain.utils import BlockchainManager, serialize_model_data
+from apps.presentations.models import PresentationRequest
+from apps.schools.models import PresentationType
+from apps.users.models import CustomUser
+
+
+class SerializeModelDataTests(TestCase):
+    def setUp(self):
+        student = CustomUser.objects.create_user(username='student1', email='student1@example.com', password='pass')
+        ptype, _ = PresentationType.objects.get_or_create(name='Thesis Defense')
+        self.presentation = PresentationRequest.objects.create(
+            student=student,
+            research_title='Original title',
+            presentation_type=ptype,
+            proposed_date=timezone.now(),
+            research_document='dummy.pdf',
+            presentation_slides='slides.pdf'
+        )
+
+    def test_partial_save_within_batch_is_serialized_afresh(self):
+        BlockchainManager.start_batch()
+        try:
+            serialize_model_data(self.presentation)
+
+            # update_fields without updated_at leaves the auto_now timestamp as it was
+            self.presentation.research_title = 'Changed title'
+            self.presentation.save(update_fields=['research_title'])
+
+            data = serialize_model_data(self.presentation)
+        finally:
+            BlockchainManager.flush_batch()
+
+        self.assertEqual(data['research_title'], 'Changed title')
@@ -0,0 +1,61 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.blockchain.models import BlockchainRecord
+from apps.blockchain.views import MAX_VERIFY_SAMPLE_SIZE
+from apps.users.models import CustomUser
+
+
+class VerifyIntegrityViewTests(TestCase):
+    url = '/api/blockchain/records/verify_integrity/'
+
+    def setUp(self):
+        cache.clear()
+        admin = CustomUser.objects.create_user(
+            username='admin1', email='admin1@example.com', password='pass', is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+        BlockchainRecord.append_blocks([
+            {
+                'record_type': 'user_update',
+                'record_data': {'model': 'CustomUser', 'model_id': str(i), 'operation': 'update', 'data': {}},
+                'user_id': None,
+                'presentation_id': None,
+                'ip_address': None,
+            }
+            for i in range(5)
+        ])
+
+    def test_sample_outside_range_is_rejected(self):
+        for sample in ('0', str(MAX_VERIFY_SAMPLE_SIZE + 1), 'abc', '-3'):
+            with self.subTest(sample=sample):
+                response = self.client.get(self.url, {'sample': sample})
+                self.assertEqual(response.status_code, 400)
+
+    def test_sample_without_checkpoints_reports_nothing_verified(self):
+        response = self.client.get(self.url, {'sample': '5'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['is_valid'])
+        self.assertEqual(response.data['verified_blocks'], [])
+        self.assertEqual(response.data['message'], 'No blocks were verified')
+
+    def test_full_check_reports_verified_range(self):
+        last_block = BlockchainRecord.objects.order_by('-block_number').first().block_number
+
+        response = self.client.get(self.url)
+
+        self.assertTrue(response.data['is_valid'])
+        self.assertEqual(response.data['mode'], 'full')
+        self.assertEqual((response.data['verified_from'], response.data['verified_to']), (1, last_block))
+
+    def test_incremental_check_without_new_blocks_reports_nothing_verified(self):
+        self.client.get(self.url)
+
+        response = self.client.get(self.url, {'incremental': 'true'})
+
+        self.assertIsNone(response.data['is_valid'])
+        self.assertEqual(response.data['mode'], 'incremental')
+        self.assertIsNone(response.data['verified_from'])
@@ -1,10 +1,28 @@
 """
 Blockchain utility functions for tamper-proof data management
 """
+import django
+import functools
 import hashlib
-import json
+import logging
+import orjson
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from django.conf import settings
+from django.db import models, transaction
 from django.utils import timezone
-from apps.blockchain.models import BlockchainRecord
+from apps.blockchain.models import (
+    BlockchainRecord, IntegrityWatermark, MerkleCheckpoint,
+    GENESIS_PREVIOUS_HASH, MERKLE_EPOCH_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-thread buffer of block entries committed during the current request
+_batch = threading.local()
 
 
 class BlockchainManager:
@@ -22,6 +40,60 @@ class BlockchainManager:
             user: User performing the operation
             ip_address: IP address of the request
         """
+        entry = BlockchainManager.build_entry(record_type, model_instance, operation, user, ip_address)
+        return BlockchainRecord.append_blocks([entry])[0]
+    
+    @staticmethod
+    def queue_operation(record_type, model_instance, operation='create', user=None, ip_address=None):
+        """
+        Record an operation once the surrounding transaction commits.
+        
+        The entry is snapshotted now, so it reflects the object as it was saved.
+        Inside a request batch (see BlockchainBatchMiddleware) it is written with the
+        rest of the batch when the request finishes; otherwise it is written on commit.
+        Either way the write itself goes through dispatch_entries.
+        """
+        entry = BlockchainManager.build_entry(record_type, model_instance, operation, user, ip_address)
+        pending = getattr(_batch, 'entries', None)
+        if pending is None:
+            transaction.on_commit(lambda: BlockchainManager.dispatch_entries([entry]))
+        else:
+            transaction.on_commit(lambda: pending.append(entry))
+    
+    @staticmethod
+    def dispatch_entries(entries):
+        """
+        Append entries to the chain in a Celery worker, or right away when
+        BLOCKCHAIN_ASYNC_RECORDING is off or the task cannot be queued.
+        """
+        if not entries:
+            return
+        
+        if getattr(settings, 'BLOCKCHAIN_ASYNC_RECORDING', True):
+            from apps.blockchain.tasks import record_blocks
+            try:
+                record_blocks.delay(entries)
+                return
+            except Exception:
+                logger.exception('Could not queue blockchain records, writing them synchronously')
+        
+        BlockchainRecord.append_blocks(entries)
+    
+    @staticmethod
+    def start_batch():
+        """Start buffering queued operations for the current thread"""
+        _batch.entries = []
+    
+    @staticmethod
+    def flush_batch():
+        """Dispatch every buffered operation as one batch and stop buffering"""
+        pending = getattr(_batch, 'entries', None)
+        _batch.entries = None
+        BlockchainManager.dispatch_entries(pending)
+    
+    @staticmethod
+    def build_entry(record_type, model_instance, operation='create', user=None, ip_address=None):
+        """Build the create_block arguments recording an operation on model_instance"""
         # Prepare record data
         record_data = {
             'operation': operation,
@@ -32,60 +104,221 @@ class BlockchainManager:
         }
         
         # Determine presentation if applicable
-        presentation = None
-        if hasattr(model_instance, 'presentation'):
-            presentation = model_instance.presentation
-        elif model_instance.__class__.__name__ == 'PresentationRequest':
-            presentation = model_instance
-        
-        # Create blockchain record
-        block = BlockchainRecord.create_block(
-            record_type=record_type,
-            record_data=record_data,
-            user=user,
-            presentation=presentation,
-            ip_address=ip_address
-        )
+        presentation_id = getattr(model_instance, 'presentation_id', None)
+        if presentation_id is None and model_instance.__class__.__name__ == 'PresentationRequest':
+            presentation_id = model_instance.pk
         
-        return block
+        # Only JSON-safe values, so the entry can be handed to a Celery task
+        return {
+            'record_type': record_type,
+            'record_data': record_data,
+            'user_id': str(user.pk) if user else None,
+            'presentation_id': str(presentation_id) if presentation_id else None,
+            'ip_address': ip_address,
+        }
     
     @staticmethod
-    def verify_chain_integrity():
+    def verify_chain_integrity(full=True):
         """
-        Verify the integrity of the entire blockchain
-        Returns: (is_valid, errors_list)
+        Verify the integrity of the blockchain
+        
+        By default every block is rehashed and relinked from the genesis block.
+        Pass full=False to only check the blocks appended since the stored
+        IntegrityWatermark, after checking that the watermark block still carries
+        the hash it was verified with. The blocks before the watermark are NOT
+        rechecked in that mode, so tampering with them goes unnoticed until the
+        next full check.
+        
+        Returns: (is_valid, errors_list, verified_range) where verified_range is the
+        (first, last) block numbers that were checked, or None if there were none
         """
         blocks = BlockchainRecord.objects.order_by('block_number')
         errors = []
         
-        if not blocks.exists():
-            return True, []
-        
-        previous_block = None
-        for block in blocks:
-            # Check if previous hash matches
-            if previous_block:
-                if block.previous_hash != previous_block.current_hash:
-                    errors.append(f"Block #{block.block_number}: Previous hash mismatch")
+        watermark = IntegrityWatermark.get_watermark()
+        expected_previous_hash = GENESIS_PREVIOUS_HASH
+        is_genesis = True
+        if not full and watermark.block_number:
+            anchor_hash = BlockchainRecord.objects.filter(
+                block_number=watermark.block_number
+            ).values_list('current_hash', flat=True).first()
+            
+            if anchor_hash == watermark.block_hash:
+                blocks = blocks.filter(block_number__gt=watermark.block_number)
+                expected_previous_hash = anchor_hash
+                is_genesis = False
             else:
-                # Genesis block should have all zeros
-                if block.previous_hash != "0" * 64:
-                    errors.append(f"Block #{block.block_number}: Invalid genesis block")
+                # The verified prefix changed; rescan everything to locate the damage
+                errors.append((
+                    watermark.block_number,
+                    f"Block #{watermark.block_number}: Differs from the last verified chain"
+                ))
+        
+        # Rescans from genesis are the long forensic path; rehash those on all cores
+        executor = None
+        workers = os.cpu_count() or 1
+        if workers > 1 and is_genesis and blocks.count() >= _PARALLEL_VERIFY_THRESHOLD:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=django.setup)
+        
+        # Phase A checks the links while streaming the chain in chunks, so memory
+        # stays constant regardless of length. Phase B rehashes each chunk, either
+        # inline or in a worker process, keeping a bounded number of chunks in flight.
+        pending = deque()
+        first_block_number = last_block_number = None
+        chunk = []
+        try:
+            for row in blocks.values_list(*_VERIFIED_FIELDS).iterator(chunk_size=_VERIFY_CHUNK_SIZE):
+                block_number, previous_hash, current_hash = row[:3]
+                
+                # Check if previous hash matches
+                if previous_hash != expected_previous_hash:
+                    if is_genesis:
+                        # Genesis block should have all zeros
+                        errors.append((block_number, f"Block #{block_number}: Invalid genesis block"))
+                    else:
+                        errors.append((block_number, f"Block #{block_number}: Previous hash mismatch"))
+                
+                expected_previous_hash = current_hash
+                if first_block_number is None:
+                    first_block_number = block_number
+                last_block_number = block_number
+                is_genesis = False
+                
+                chunk.append(row)
+                if len(chunk) == _VERIFY_CHUNK_SIZE:
+                    pending.append(_submit_block_rows(executor, chunk))
+                    chunk = []
+                    if len(pending) > 2 * workers:
+                        errors.extend(pending.popleft().result())
             
-            # Verify current hash
-            calculated_hash = BlockchainRecord.calculate_hash(
-                block.block_number,
-                block.previous_hash,
-                block.record_data,
-                block.timestamp
+            if chunk:
+                pending.append(_submit_block_rows(executor, chunk))
+            for result in pending:
+                errors.extend(result.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        
+        # Report in chain order; the sort is stable so link errors stay first per block
+        errors.sort(key=lambda error: error[0])
+        errors = [message for _, message in errors]
+        
+        if errors:
+            # Make the next incremental check start from the genesis block again
+            if watermark.block_number:
+                watermark.block_number = 0
+                watermark.block_hash = ''
+                watermark.save(update_fields=['block_number', 'block_hash'])
+        elif last_block_number is not None:
+            watermark.block_number = last_block_number
+            watermark.block_hash = expected_previous_hash
+            watermark.verified_at = timezone.now()
+            watermark.save(update_fields=['block_number', 'block_hash', 'verified_at'])
+            BlockchainManager.build_merkle_checkpoints(last_block_number)
+        
+        verified_range = (first_block_number, last_block_number) if last_block_number is not None else None
+        return len(errors) == 0, errors, verified_range
+    
+    @staticmethod
+    def build_merkle_checkpoints(up_to_block):
+        """
+        Store a MerkleCheckpoint for every complete epoch of MERKLE_EPOCH_SIZE blocks
+        ending at or before up_to_block that does not have one yet. Only call this
+        with a block number the chain has just been verified up to.
+        """
+        complete_epochs = up_to_block // MERKLE_EPOCH_SIZE
+        existing = set(
+            MerkleCheckpoint.objects.filter(epoch__lt=complete_epochs).values_list('epoch', flat=True)
+        )
+        
+        checkpoints = []
+        for epoch in range(complete_epochs):
+            if epoch in existing:
+                continue
+            
+            block_start = epoch * MERKLE_EPOCH_SIZE + 1
+            block_end = block_start + MERKLE_EPOCH_SIZE - 1
+            leaves = list(
+                BlockchainRecord.objects.filter(block_number__range=(block_start, block_end))
+                .order_by('block_number')
+                .values_list('current_hash', flat=True)
             )
+            if len(leaves) != MERKLE_EPOCH_SIZE:
+                # Gap in the numbering; leave this epoch without a checkpoint
+                continue
             
-            if block.current_hash != calculated_hash:
-                errors.append(f"Block #{block.block_number}: Hash verification failed")
+            checkpoints.append(MerkleCheckpoint(
+                epoch=epoch,
+                block_start=block_start,
+                block_end=block_end,
+                root=compute_merkle_root(leaves)
+            ))
+        
+        MerkleCheckpoint.objects.bulk_create(checkpoints, ignore_conflicts=True)
+        return len(checkpoints)
+    
+    @staticmethod
+    def verify_chain_integrity_sampled(sample_size=10):
+        """
+        Spot-check the checkpointed part of the chain.
+        
+        Picks sample_size random blocks from epochs that have a MerkleCheckpoint. For
+        each sampled epoch the leaf hashes are read with one indexed range query and
+        the Merkle root is recomputed and compared with the stored root, which
+        catches any rewritten block hash in the epoch. Each sampled block is then
+        rehashed from its contents and its link to the previous block checked. The
+        cost depends on the sample size, not on the length of the chain.
+        
+        Returns: (is_valid, errors_list, sampled_block_numbers)
+        """
+        checkpoints = list(MerkleCheckpoint.objects.all())
+        if not checkpoints:
+            return True, [], []
+        
+        sampled = {}
+        for _ in range(sample_size):
+            checkpoint = random.choice(checkpoints)
+            sampled.setdefault(checkpoint, set()).add(
+                random.randint(checkpoint.block_start, checkpoint.block_end)
+            )
+        
+        errors = []
+        for checkpoint, block_numbers in sorted(sampled.items(), key=lambda item: item[0].epoch):
+            leaves = dict(
+                BlockchainRecord.objects.filter(
+                    block_number__range=(checkpoint.block_start, checkpoint.block_end)
+                ).values_list('block_number', 'current_hash')
+            )
+            leaf_hashes = [leaves.get(number) for number in range(checkpoint.block_start, checkpoint.block_end + 1)]
+            try:
+                root = compute_merkle_root(leaf_hashes)
+            except (TypeError, ValueError):
+                # Missing block or a hash that is not a hex digest
+                root = None
+            if root != checkpoint.root:
+                errors.append(
+                    f"Blocks #{checkpoint.block_start}-#{checkpoint.block_end}: Merkle root mismatch"
+                )
             
-            previous_block = block
+            for block in BlockchainRecord.objects.filter(
+                block_number__in=block_numbers
+            ).only(*_VERIFIED_FIELDS).order_by('block_number'):
+                previous_number = block.block_number - 1
+                if previous_number in leaves:
+                    expected_previous_hash = leaves[previous_number]
+                elif previous_number == 0:
+                    expected_previous_hash = GENESIS_PREVIOUS_HASH
+                else:
+                    expected_previous_hash = BlockchainRecord.objects.filter(
+                        block_number=previous_number
+                    ).values_list('current_hash', flat=True).first()
+                
+                if block.previous_hash != expected_previous_hash:
+                    errors.append(f"Block #{block.block_number}: Previous hash mismatch")
+                errors.extend(_check_block_contents(block))
         
-        return len(errors) == 0, errors
+        sampled_block_numbers = sorted(number for numbers in sampled.values() for number in numbers)
+        return len(errors) == 0, errors, sampled_block_numbers
     
     @staticmethod
     def get_audit_trail(model_instance):
@@ -94,62 +327,188 @@ class BlockchainManager:
         model_id = model_instance.pk
         
         blocks = BlockchainRecord.objects.filter(
-            record_data__model=model_name,
-            record_data__model_id=model_id
-        ).order_by('block_number')
+            target_model=model_name,
+            target_id=str(model_id)
+        ).select_related('user').order_by('block_number')
         
         trail = []
         for block in blocks:
+            record_data = block.record_data
             trail.append({
                 'block_number': block.block_number,
                 'timestamp': block.timestamp,
                 'record_type': block.record_type,
-                'operation': block.record_data.get('operation'),
+                'operation': record_data.get('operation'),
                 'user': block.user.get_full_name() if block.user else 'System',
-                'data': block.record_data.get('data'),
+                'data': record_data.get('data'),
                 'hash': block.current_hash
             })
         
         return trail
 
 
-def serialize_model_data(instance):
+# Columns read when verifying blocks
+_VERIFIED_FIELDS = (
+    'block_number', 'previous_hash', 'current_hash', 'hash_version', 'record_payload', 'timestamp',
+    'target_model', 'target_id',
+)
+
+
+# Rows fetched and rehashed per chunk when verifying the chain
+_VERIFY_CHUNK_SIZE = 2000
+
+# Chain length from which a rescan from genesis is spread over a process pool
+_PARALLEL_VERIFY_THRESHOLD = 50000
+
+
+def _submit_block_rows(executor, rows):
+    """Check a chunk of rows in the executor, or inline when there is none"""
+    if executor is not None:
+        return executor.submit(_check_block_rows, rows)
+    
+    future = Future()
+    future.set_result(_check_block_rows(rows))
+    return future
+
+
+def _check_block_rows(rows):
     """
-    Serialize model instance data for blockchain storage
+    Check a chunk of _VERIFIED_FIELDS value tuples with _check_block_contents.
+    Runs in worker processes, so it only takes and returns plain values.
+    
+    Returns: list of (block_number, error) pairs
     """
-    data = {}
+    errors = []
+    for row in rows:
+        block = BlockchainRecord(**dict(zip(_VERIFIED_FIELDS, row)))
+        errors.extend((block.block_number, error) for error in _check_block_contents(block))
+    return errors
+
+
+def _check_block_contents(block):
+    """Rehash a block from its contents and check the columns derived from its data"""
+    errors = []
     
-    # Get all fields except relations and auto fields
-    for field in instance._meta.fields:
-        field_name = field.name
-        
-        # Skip auto-generated fields
-        if field_name in ['id', 'created_at', 'updated_at']:
-            continue
-        
+    try:
+        calculated_hash = BlockchainRecord.calculate_hash(
+            block.block_number,
+            block.previous_hash,
+            block.record_payload,
+            block.timestamp,
+            block.hash_version
+        )
+    except ValueError:
+        # A previous_hash that is not a hex digest or a payload that does not decode
+        calculated_hash = None
+    
+    if block.current_hash != calculated_hash:
+        errors.append(f"Block #{block.block_number}: Hash verification failed")
+    
+    # The audit lookup columns are not hashed, so check them against the hashed data
+    try:
+        record_data = block.record_data
+    except ValueError:
+        record_data = None
+    if not isinstance(record_data, dict):
+        record_data = {}
+    if (block.target_model != record_data.get('model', '') or
+            block.target_id != record_data.get('model_id', '')):
+        errors.append(f"Block #{block.block_number}: Audit lookup fields do not match record data")
+    
+    return errors
+
+
+def compute_merkle_root(leaf_hashes):
+    """
+    Compute the Merkle root (hex) of a list of hex SHA-256 hashes. Each level hashes
+    concatenated pairs of raw digests; an odd node out is paired with itself.
+    """
+    level = [bytes.fromhex(leaf) for leaf in leaf_hashes]
+    if not level:
+        return GENESIS_PREVIOUS_HASH
+    
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [
+            hashlib.sha256(level[i] + level[i + 1]).digest()
+            for i in range(0, len(level), 2)
+        ]
+    return level[0].hex()
+
+
+def serialize_model_data(instance):
+    """Serialize model instance data for blockchain storage"""
+    data = {}
+    for field_name, emit in _serialization_plan(type(instance)):
         try:
-            value = getattr(instance, field_name)
-            
-            # Handle different field types
-            if hasattr(value, 'isoformat'):  # DateTime fields
-                data[field_name] = value.isoformat()
-            elif hasattr(value, 'pk'):  # Foreign keys
-                # Convert related PKs to strings to ensure JSON serializability
-                data[field_name] = {
-                    'id': str(value.pk),
-                    'str': str(value)
-                }
-            elif isinstance(value, (list, dict)):
-                data[field_name] = value
-            else:
-                data[field_name] = str(value) if value is not None else None
-        except:
+            data[field_name] = emit(getattr(instance, field_name))
+        except Exception:
+            # e.g. a foreign key pointing at a missing row
             continue
     
     return data
 
 
+# Auto-generated fields left out of the serialized data
+_SKIPPED_FIELDS = frozenset(['id', 'created_at', 'updated_at'])
+
+
+def _emit_temporal(value):
+    return value.isoformat() if value is not None else None
+
+
+def _emit_related(value):
+    if value is None:
+        return None
+    # Convert related PKs to strings to ensure JSON serializability
+    return {
+        'id': str(value.pk),
+        'str': str(value)
+    }
+
+
+def _emit_json(value):
+    if isinstance(value, (list, dict)):
+        return value
+    return str(value) if value is not None else None
+
+
+def _emit_text(value):
+    return str(value) if value is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _serialization_plan(model_class):
+    """
+    Build the (field_name, emit) pairs used to serialize instances of model_class.
+    
+    Models can declare the recorded fields in a BLOCKCHAIN_FIELDS tuple; otherwise
+    every concrete field except _SKIPPED_FIELDS is recorded. The emitter for each
+    field is chosen once per class from the field type, so serializing an instance
+    does no per-value type checks.
+    """
+    field_names = getattr(model_class, 'BLOCKCHAIN_FIELDS', None)
+    if field_names is not None:
+        fields = [model_class._meta.get_field(name) for name in field_names]
+    else:
+        fields = [field for field in model_class._meta.fields if field.name not in _SKIPPED_FIELDS]
+    
+    plan = []
+    for field in fields:
+        if field.is_relation:
+            emit = _emit_related
+        elif isinstance(field, (models.DateField, models.TimeField)):
+            emit = _emit_temporal
+        elif isinstance(field, models.JSONField):
+            emit = _emit_json
+        else:
+            emit = _emit_text
+        plan.append((field.name, emit))
+    
+    return tuple(plan)
+
+
 def calculate_data_hash(data):
     """Calculate SHA-256 hash of data"""
-    data_string = json.dumps(data, sort_keys=True)
-    return hashlib.sha256(data_string.encode()).hexdigest()
+    return hashlib.sha256(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).hexdigest()
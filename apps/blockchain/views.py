@@ -5,6 +5,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from apps.blockchain.models import BlockchainRecord
 from apps.blockchain.utils import BlockchainManager
@@ -12,11 +13,15 @@ from apps.presentations.models import PresentationRequest
 from apps.users.models import CustomUser
 
 
+# Largest ?sample= accepted by verify_integrity
+MAX_VERIFY_SAMPLE_SIZE = 1000
+
+
 class BlockchainViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for blockchain operations
     """
-    queryset = BlockchainRecord.objects.all()
+    queryset = BlockchainRecord.objects.select_related('user', 'presentation').all()
     permission_classes = [IsAuthenticated]
     
     def get_serializer_class(self):
@@ -46,17 +51,50 @@ class BlockchainViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
     def verify_integrity(self, request):
         """
-        Verify the integrity of the entire blockchain
+        Verify the integrity of the blockchain
+        
+        The whole chain is rehashed from the genesis block. ?incremental=true only
+        checks the blocks appended since the last successful check, and
+        ?sample=<n> spot-checks n random checkpointed blocks against their Merkle
+        roots. The response says which blocks were actually checked; when none
+        were, is_valid is null rather than true.
         """
-        is_valid, errors = BlockchainManager.verify_chain_integrity()
+        incremental = request.query_params.get('incremental', '').lower() in ('1', 'true', 'yes')
+        sample = request.query_params.get('sample')
+        verified = {}
+        if sample is not None:
+            if not (sample.isdigit() and 1 <= int(sample) <= MAX_VERIFY_SAMPLE_SIZE):
+                return Response(
+                    {'error': f'sample must be a whole number from 1 to {MAX_VERIFY_SAMPLE_SIZE}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            mode = 'sampled'
+            is_valid, errors, verified['verified_blocks'] = BlockchainManager.verify_chain_integrity_sampled(int(sample))
+            checked_any = bool(verified['verified_blocks'])
+        else:
+            mode = 'incremental' if incremental else 'full'
+            is_valid, errors, verified_range = BlockchainManager.verify_chain_integrity(full=not incremental)
+            verified['verified_from'], verified['verified_to'] = verified_range or (None, None)
+            checked_any = verified_range is not None
         
         total_blocks = BlockchainRecord.objects.count()
         
+        if errors:
+            message = 'Blockchain integrity check failed'
+        elif not checked_any:
+            # e.g. no Merkle checkpoints to sample yet, or no blocks since the last check
+            is_valid = None
+            message = 'No blocks were verified'
+        else:
+            message = 'Blockchain integrity verified successfully'
+        
         return Response({
             'is_valid': is_valid,
+            'mode': mode,
+            **verified,
             'total_blocks': total_blocks,
             'errors': errors,
-            'message': 'Blockchain integrity verified successfully' if is_valid else 'Blockchain integrity check failed'
+            'message': message
         })
     
     @action(detail=False, methods=['get'], url_path='audit-trail/presentation/(?P<presentation_id>[^/.]+)')
@@ -113,16 +151,20 @@ class BlockchainViewSet(viewsets.ReadOnlyModelViewSet):
         """
         Get blockchain statistics
         """
-        total_blocks = BlockchainRecord.objects.count()
-        
-        # Count by record type
-        record_type_counts = {}
-        for choice in BlockchainRecord.RECORD_TYPE_CHOICES:
-            count = BlockchainRecord.objects.filter(record_type=choice[0]).count()
-            record_type_counts[choice[1]] = count
+        # Count by record type in a single grouped query
+        counts = dict(
+            BlockchainRecord.objects.order_by()
+            .values_list('record_type')
+            .annotate(count=Count('id'))
+        )
+        total_blocks = sum(counts.values())
+        record_type_counts = {
+            label: counts.get(code, 0)
+            for code, label in BlockchainRecord.RECORD_TYPE_CHOICES
+        }
         
         # Get latest blocks (fetch more for frontend pagination)
-        latest_blocks = BlockchainRecord.objects.order_by('-block_number')[:50]
+        latest_blocks = self.get_queryset().order_by('-block_number')[:50]
         
         serializer = self.get_serializer(latest_blocks, many=True)
         
@@ -1,8 +1,55 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import Notification, NotificationPreference, ReminderLog
 from django.contrib.contenttypes.admin import GenericTabularInline
 
 
+# Below this many estimated rows an exact COUNT(*) is cheap enough
+ESTIMATED_COUNT_THRESHOLD = 1000
+
+
+def estimated_row_count(model, using):
+    """Row count of model's table from the database statistics, or None if unavailable"""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                [model._meta.db_table]
+            )
+        elif connection.vendor == 'postgresql':
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [model._meta.db_table]
+            )
+        else:
+            return None
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for large, append-only tables: an unfiltered changelist takes its
+    total from the table statistics instead of a full COUNT(*). Filtered or
+    searched lists and small tables are counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            estimate = estimated_row_count(self.object_list.model, self.object_list.db)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = [
@@ -10,6 +57,13 @@ class NotificationAdmin(admin.ModelAdmin):
     ]
     list_filter = ['notification_type', 'is_read', 'created_at', 'priority']
     search_fields = ['recipient__username', 'title', 'message']
+    list_select_related = ['recipient', 'content_type']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Load the related objects of a page with one query per content type
+        return super().get_queryset(request).prefetch_related('content_object')
 
     def related_object_link(self, obj):
         """Display a link to the related object if it exists"""
@@ -37,3 +91,7 @@ class ReminderLogAdmin(admin.ModelAdmin):
     ]
     list_filter = ['minutes_before', 'channel', 'status', 'created_at']
     search_fields = ['recipient__username', 'presentation__research_title']
+    # PresentationRequest.__str__ reads the student and presentation type
+    list_select_related = ['recipient', 'presentation__student', 'presentation__presentation_type']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
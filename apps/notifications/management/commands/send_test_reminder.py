@@ -2,7 +2,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from apps.presentations.models import PresentationRequest, PresentationSchedule
-from apps.notifications.utils import send_presentation_reminders_to_all_actors
+from apps.notifications.utils import send_presentation_reminders_to_all_actors, with_reminder_relations
 
 
 class Command(BaseCommand):
@@ -16,14 +16,16 @@ class Command(BaseCommand):
         pid = options.get('presentation_id')
         minutes = options.get('minutes', 1)
 
+        # Only the columns and relations the reminders read
+        presentations = with_reminder_relations(PresentationRequest.objects)
         if pid:
             try:
-                p = PresentationRequest.objects.get(id=pid)
+                p = presentations.get(id=pid)
             except PresentationRequest.DoesNotExist:
                 self.stderr.write(self.style.ERROR(f'Presentation with id {pid} not found'))
                 return
         else:
-            p = PresentationRequest.objects.order_by('-created_at').first()
+            p = presentations.order_by('-created_at').first()
             if not p:
                 self.stderr.write(self.style.ERROR('No presentations found'))
                 return
@@ -33,7 +35,7 @@ class Command(BaseCommand):
         start_min = now + timezone.timedelta(minutes=minutes)
         end_min = start_min + timezone.timedelta(seconds=59)
 
-        has_schedule = PresentationSchedule.objects.filter(presentation=p, start_time__gte=start_min, start_time__lt=end_min).exists()
+        has_schedule = PresentationSchedule.objects.filter(presentation_id=p.id, start_time__gte=start_min, start_time__lt=end_min).exists()
         if not has_schedule:
             self.stdout.write(self.style.WARNING(f'Presentation {p.id} does not have a schedule within the {minutes}-minute window; sending reminder anyway.'))
 
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0004_alter_notification_notification_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["notification_type"], name="notificatio_notific_19df93_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["created_at"], name="notificatio_created_e4c995_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["-priority", "-created_at"],
+                name="notificatio_priorit_66bf3c_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0006_notification_admin_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["recipient", "is_archived", "-created_at"],
+                name="notif_inbox_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="notification",
+            name="notificatio_recipie_d51e24_idx",
+        ),
+        migrations.RenameIndex(
+            model_name="notification",
+            new_name="notif_pri_created_idx",
+            old_name="notificatio_priorit_66bf3c_idx",
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0007_notification_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["content_type", "object_id"], name="notif_gfk_idx"
+            ),
+        ),
+    ]
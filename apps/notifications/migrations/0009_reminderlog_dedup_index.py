@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0008_notification_gfk_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reminderlog",
+            index=models.Index(
+                fields=["presentation", "minutes_before", "status"],
+                name="rlog_dedup_idx",
+            ),
+        ),
+    ]
@@ -1,12 +1,50 @@
 import uuid
 
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 from django.utils import timezone
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from apps.presentations.models import PresentationRequest
 
 
+# Rows per INSERT when notifications and reminder logs are bulk-created. Django
+# lowers it further on backends with a smaller parameter limit (SQLite).
+BULK_BATCH_SIZE = 500
+
+# Seconds a user's cached unread count may be served before it is recounted.
+# The count lives in the shared cache (CACHES), so dropping it is seen by every
+# web worker.
+UNREAD_COUNT_CACHE_TIMEOUT = 30
+
+
+def unread_count_cache_key(user_id):
+    return f'notif:unread:{user_id}'
+
+
+def forget_unread_count(user_id):
+    """
+    Drop a user's cached unread count after their notifications change. Inside a
+    transaction this waits for the commit, so another process cannot cache the
+    count from before it.
+    """
+    key = unread_count_cache_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class NotificationQuerySet(models.QuerySet):
+    def for_object(self, obj):
+        """Notifications linked to obj through content_object"""
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(obj),
+            object_id=str(obj.pk),
+        )
+
+    def mark_read(self):
+        """Mark the unread notifications in this queryset as read with one UPDATE"""
+        return self.filter(is_read=False).update(is_read=True, read_at=timezone.now())
+
+
 class Notification(models.Model):
     """
     Global notification model that can reference ANY backend model
@@ -80,12 +118,28 @@ class Notification(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = NotificationQuerySet.as_manager()
+
+    # Fields recorded in blockchain data (see apps.blockchain.utils.serialize_model_data)
+    BLOCKCHAIN_FIELDS = (
+        'recipient', 'notification_type', 'title', 'message', 'content_type', 'object_id',
+        'related_user', 'action_url', 'is_read', 'read_at', 'is_archived', 'priority',
+    )
+
     class Meta:
         db_table = 'notifications'
         ordering = ['-priority', '-created_at']
         indexes = [
             models.Index(fields=['recipient', 'is_read']),
-            models.Index(fields=['recipient', 'is_archived']),
+            # A user's inbox in the API: filtered and ordered without a sort
+            models.Index(fields=['recipient', 'is_archived', '-created_at'], name='notif_inbox_idx'),
+            # Notifications about a given object, through content_object
+            models.Index(fields=['content_type', 'object_id'], name='notif_gfk_idx'),
+            # Admin list filters
+            models.Index(fields=['notification_type']),
+            models.Index(fields=['created_at']),
+            # Meta.ordering
+            models.Index(fields=['-priority', '-created_at'], name='notif_pri_created_idx'),
         ]
 
     def __str__(self):
@@ -96,7 +150,11 @@ class Notification(models.Model):
         if not self.is_read:
             self.is_read = True
             self.read_at = timezone.now()
-            self.save(update_fields=['is_read', 'read_at'])
+            # Plain UPDATE; guarded on is_read so a concurrent read keeps its read_at
+            type(self).objects.filter(pk=self.pk, is_read=False).update(
+                is_read=True, read_at=self.read_at
+            )
+            forget_unread_count(self.recipient_id)
 
 
 class ReminderLog(models.Model):
@@ -115,10 +173,36 @@ class ReminderLog(models.Model):
     class Meta:
         db_table = 'reminder_logs'
         ordering = ['-created_at']
+        indexes = [
+            # Already-reminded check of the reminder beat task
+            models.Index(fields=['presentation', 'minutes_before', 'status'], name='rlog_dedup_idx'),
+        ]
 
     def __str__(self):
         return f"Reminder {self.channel} → {self.recipient.username} for {self.presentation}"
 
+    @classmethod
+    def log_bulk(cls, presentation, recipients, minutes_before, channel, status='sent'):
+        """
+        Log a reminder for each recipient with batched INSERTs. Every call adds its
+        rows, so repeated and manual reminders all show up in the history; the
+        beat task avoids duplicate sends with its own claim, see
+        send_upcoming_reminders.
+        """
+        return cls.objects.bulk_create(
+            [
+                cls(
+                    presentation=presentation,
+                    recipient=recipient,
+                    minutes_before=minutes_before,
+                    channel=channel,
+                    status=status,
+                )
+                for recipient in recipients
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
+
 
 class NotificationPreference(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
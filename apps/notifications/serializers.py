@@ -72,12 +72,14 @@ class NotificationSerializer(serializers.ModelSerializer):
         Return minimal, safe info about the related object
         (works for ANY table)
         """
-        if not obj.content_type or not obj.object_id:
+        if not obj.content_type_id or not obj.object_id:
             return None
 
+        # Served from ContentType's in-process cache, no query per row
+        content_type = ContentType.objects.get_for_id(obj.content_type_id)
         return {
-            'type': obj.content_type.model,     # e.g. "presentationrequest"
-            'app': obj.content_type.app_label,  # e.g. "presentations"
+            'type': content_type.model,     # e.g. "presentationrequest"
+            'app': content_type.app_label,  # e.g. "presentations"
             'id': str(obj.object_id)
         }
 
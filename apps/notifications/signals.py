@@ -0,0 +1,13 @@
+"""
+Django signals that keep cached notification state in step with the table
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Notification, forget_unread_count
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def notification_changed(sender, instance, **kwargs):
+    """Recount the recipient's unread notifications on their next poll"""
+    forget_unread_count(instance.recipient_id)
@@ -1,15 +1,32 @@
 import logging
 
 from celery import shared_task
-from django.db.models import Q
+from django.core.cache import cache
+from django.core.mail import get_connection
+from django.db import DatabaseError
 from django.utils import timezone
 
 from apps.notifications.models import ReminderLog
-from apps.presentations.models import PresentationRequest, PresentationSchedule
-from .utils import send_presentation_reminders_to_all_actors
+from apps.presentations.models import PresentationRequest
+from apps.users.models import CustomUser
+from .utils import (
+    _send_email, deliver_assignment_email, presentations_starting_between,
+    send_presentation_reminders_to_all_actors, send_presentation_time_reminder,
+    with_reminder_relations,
+)
 
 logger = logging.getLogger(__name__)
 
+# Seconds a presentation stays claimed after its reminders are dispatched
+REMINDER_LOCK_TIMEOUT = 10 * 60
+# Retries of send_one_reminder after a database or mail server failure
+REMINDER_MAX_RETRIES = 3
+REMINDER_RETRY_DELAY = 60
+
+
+def _reminder_lock_key(presentation_id, minutes_before):
+    return f'reminders:{presentation_id}:{minutes_before}'
+
 
 @shared_task(bind=True)
 def send_upcoming_reminders(self, minutes_before=30):
@@ -21,49 +38,124 @@ def send_upcoming_reminders(self, minutes_before=30):
     date field is populated.
 
     Skips presentations that already received a reminder for this window
-    (checked via ReminderLog).
+    (checked via ReminderLog in a subquery of the same statement, so an idle
+    tick costs a single query).
+
+    Each presentation is sent by its own send_one_reminder task, so the worker
+    pool sends them in parallel and this task returns without waiting on SMTP.
     """
     now = timezone.now()
     window_start = now + timezone.timedelta(minutes=minutes_before)
     window_end = window_start + timezone.timedelta(seconds=59)
 
-    # ---------- collect presentation ids from both schedule & actual_date ----------
-    schedule_pr_ids = list(
-        PresentationSchedule.objects
-        .filter(start_time__gte=window_start, start_time__lt=window_end)
-        .values_list('presentation_id', flat=True)
-    )
+    # ---------- presentations in the window by schedule or actual_date ----------
+    presentations = presentations_starting_between(window_start, window_end)
 
-    actual_date_pr_ids = list(
-        PresentationRequest.objects
-        .filter(actual_date__gte=window_start, actual_date__lt=window_end)
-        .values_list('id', flat=True)
+    # ---------- skip already-reminded presentations ----------
+    already_reminded = ReminderLog.objects.filter(
+        minutes_before=minutes_before,
+        status='sent',
+    ).values('presentation_id')
+    pending_ids = list(
+        presentations.exclude(id__in=already_reminded).order_by().values_list('id', flat=True)
     )
 
-    all_pr_ids = set(schedule_pr_ids) | set(actual_date_pr_ids)
-
-    if not all_pr_ids:
+    if not pending_ids:
         return f'No presentations in the {minutes_before}-min window'
 
-    # ---------- skip already-reminded presentations ----------
-    already_reminded = set(
-        ReminderLog.objects
-        .filter(
-            presentation_id__in=all_pr_ids,
-            minutes_before=minutes_before,
-            status='sent',
-        )
-        .values_list('presentation_id', flat=True)
-    )
-    pending_ids = all_pr_ids - already_reminded
-
-    total = 0
-    for pr in PresentationRequest.objects.filter(id__in=pending_ids).select_related('student'):
+    # ---------- fan out one send per presentation ----------
+    dispatched = 0
+    for presentation_id in pending_ids:
+        # Claim the presentation so a later tick cannot dispatch it again before its logs are written
+        lock_key = _reminder_lock_key(presentation_id, minutes_before)
+        if not cache.add(lock_key, True, timeout=REMINDER_LOCK_TIMEOUT):
+            continue
         try:
-            send_presentation_reminders_to_all_actors(pr, minutes_before=minutes_before)
-            total += 1
+            send_one_reminder.delay(str(presentation_id), minutes_before)
         except Exception:
-            logger.exception('Failed to send reminders for presentation id %s', pr.id)
+            # Not queued: let the next tick claim it again
+            cache.delete(lock_key)
+            logger.exception('Failed to queue reminders for presentation id %s', presentation_id)
             continue
+        dispatched += 1
+
+    return f'Dispatched reminders for {dispatched} presentation(s) (minutes_before={minutes_before})'
+
+
+@shared_task(bind=True, max_retries=REMINDER_MAX_RETRIES, default_retry_delay=REMINDER_RETRY_DELAY)
+def send_one_reminder(self, presentation_id, minutes_before):
+    """
+    Send the reminders for one presentation to all of its actors.
+
+    A database error or a mail server that cannot be reached is retried. Both
+    surface before any email goes out (the mail connection is opened first), so
+    a retry never sends twice. Once the retries run out the beat task's claim
+    is released, so a later tick may dispatch the presentation again.
+    """
+    try:
+        pr = with_reminder_relations(PresentationRequest.objects).get(id=presentation_id)
+    except PresentationRequest.DoesNotExist:
+        return f'Presentation {presentation_id} no longer exists'
+    except DatabaseError as exc:
+        _retry_reminder(self, exc, presentation_id, minutes_before)
+
+    try:
+        connection = get_connection()
+        connection.open()
+        try:
+            send_presentation_reminders_to_all_actors(pr, minutes_before=minutes_before, connection=connection)
+        finally:
+            connection.close()
+    except (DatabaseError, OSError) as exc:
+        # SMTPException is an OSError
+        _retry_reminder(self, exc, presentation_id, minutes_before)
+
+    return f'Sent reminders for presentation {presentation_id} (minutes_before={minutes_before})'
+
+
+def _retry_reminder(task, exc, presentation_id, minutes_before):
+    """Retry send_one_reminder, or release its claim and re-raise once the retries are used up"""
+    if task.request.retries < task.max_retries:
+        logger.warning('Retrying reminders for presentation id %s: %s', presentation_id, exc)
+        raise task.retry(exc=exc)
+
+    cache.delete(_reminder_lock_key(presentation_id, minutes_before))
+    logger.error('Failed to send reminders for presentation id %s', presentation_id, exc_info=exc)
+    raise exc
+
+
+@shared_task
+def send_presenter_reminder(presentation_id, minutes_before):
+    """Send the presenter-only reminder for one presentation."""
+    try:
+        send_presentation_time_reminder(presentation_id, minutes_before=minutes_before)
+    except PresentationRequest.DoesNotExist:
+        return f'Presentation {presentation_id} no longer exists'
+
+    return f'Sent presenter reminder for presentation {presentation_id} (minutes_before={minutes_before})'
+
+
+@shared_task
+def send_assignment_email(template_prefix, role_key, recipient_id, presentation_id, assigned_by_id, subject, message):
+    """Send an assignment email queued by the notifications.utils assignment helpers."""
+    recipient = CustomUser.objects.filter(id=recipient_id).first()
+    presentation = PresentationRequest.objects.select_related(
+        'student', 'presentation_type'
+    ).filter(id=presentation_id).first()
+    if recipient is None or presentation is None:
+        return f'Skipped {template_prefix} email: recipient or presentation no longer exists'
+
+    assigned_by = CustomUser.objects.filter(id=assigned_by_id).first() if assigned_by_id else None
+    deliver_assignment_email(template_prefix, role_key, recipient, presentation, assigned_by, subject, message)
+    return f'Sent {template_prefix} email to {recipient.email}'
+
+
+@shared_task
+def send_plain_email(recipient_id, subject, message):
+    """Send a plain-text email queued with notifications.utils.dispatch_email_task."""
+    recipient = CustomUser.objects.filter(id=recipient_id).first()
+    if recipient is None:
+        return f'Skipped email {subject!r}: recipient no longer exists'
 
-    return f'Sent reminders for {total} presentation(s) (minutes_before={minutes_before})'
+    _send_email(recipient, subject, message)
+    return f'Sent email {subject!r} to {recipient.email}'
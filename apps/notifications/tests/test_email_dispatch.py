@@ -0,0 +1,51 @@
+from django.core import mail
+from django.test import TestCase, override_settings
+from unittest.mock import patch
+
+from apps.notifications.utils import dispatch_email_task
+from apps.users.models import CustomUser
+
+
+class DispatchEmailTaskTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='mailee', email='mailee@example.com', password='pass')
+
+    def dispatch(self):
+        dispatch_email_task('send_plain_email', str(self.user.pk), 'Subject', 'Body')
+
+    @override_settings(NOTIFICATION_ASYNC_EMAIL=True)
+    @patch('apps.notifications.tasks.send_plain_email.delay')
+    def test_task_is_queued_after_commit(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dispatch()
+            mock_delay.assert_not_called()
+
+        mock_delay.assert_called_once_with(str(self.user.pk), 'Subject', 'Body')
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(NOTIFICATION_ASYNC_EMAIL=True)
+    @patch('apps.notifications.tasks.send_plain_email.delay', side_effect=ConnectionError)
+    def test_task_runs_in_process_when_it_cannot_be_queued(self, mock_delay):
+        with self.assertLogs('apps.notifications.utils', level='ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.dispatch()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['mailee@example.com'])
+
+    @override_settings(NOTIFICATION_ASYNC_EMAIL=False)
+    @patch('apps.notifications.tasks.send_plain_email.delay')
+    def test_task_runs_in_process_when_async_email_is_off(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dispatch()
+
+        mock_delay.assert_not_called()
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(NOTIFICATION_ASYNC_EMAIL=False)
+    def test_nothing_is_sent_if_the_transaction_rolls_back(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.dispatch()
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(len(mail.outbox), 0)
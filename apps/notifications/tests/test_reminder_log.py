@@ -0,0 +1,52 @@
+from django.test import TestCase
+from django.utils import timezone
+from unittest.mock import patch
+
+from apps.notifications.models import ReminderLog
+from apps.notifications.utils import (
+    send_evaluation_reminder_notification,
+    send_presentation_reminders_to_all_actors,
+)
+from apps.users.models import CustomUser
+from apps.presentations.models import PresentationRequest
+from apps.schools.models import PresentationType
+
+
+@patch('apps.notifications.utils.EmailMultiAlternatives.send')
+class ReminderLogTests(TestCase):
+    def setUp(self):
+        self.student = CustomUser.objects.create_user(username='student1', email='student1@example.com', password='pass')
+        self.examiner = CustomUser.objects.create_user(username='exam1', email='exam1@example.com', password='pass')
+        self.coordinator = CustomUser.objects.create_user(username='coord', email='coord@example.com', password='pass')
+
+        ptype, _ = PresentationType.objects.get_or_create(name='Thesis Defense')
+        self.presentation = PresentationRequest.objects.create(
+            student=self.student,
+            research_title='Test Presentation',
+            presentation_type=ptype,
+            proposed_date=timezone.now() + timezone.timedelta(minutes=15),
+            research_document='dummy.pdf',
+            presentation_slides='slides.pdf'
+        )
+
+    def logs_for(self, recipient):
+        return ReminderLog.objects.filter(presentation=self.presentation, recipient=recipient)
+
+    def test_repeated_evaluation_reminders_are_each_logged(self, mock_send):
+        send_evaluation_reminder_notification(self.examiner, self.presentation, self.coordinator)
+        send_evaluation_reminder_notification(self.examiner, self.presentation, self.coordinator)
+
+        self.assertEqual(self.logs_for(self.examiner).count(), 2)
+
+    def test_session_reminder_is_logged_alongside_evaluation_reminder(self, mock_send):
+        # Both use minutes_before=0; neither may hide the other in the history
+        send_evaluation_reminder_notification(self.student, self.presentation, self.coordinator)
+        send_presentation_reminders_to_all_actors(self.presentation, minutes_before=0)
+
+        self.assertEqual(self.logs_for(self.student).filter(minutes_before=0).count(), 2)
+
+    def test_manual_resend_is_logged_again(self, mock_send):
+        send_presentation_reminders_to_all_actors(self.presentation, minutes_before=15)
+        send_presentation_reminders_to_all_actors(self.presentation, minutes_before=15)
+
+        self.assertEqual(self.logs_for(self.student).filter(minutes_before=15).count(), 2)
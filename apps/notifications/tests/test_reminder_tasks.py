@@ -0,0 +1,84 @@
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase
+from django.utils import timezone
+from unittest.mock import patch
+
+from apps.notifications import tasks
+from apps.notifications.models import Notification, ReminderLog
+from apps.users.models import CustomUser
+from apps.presentations.models import PresentationRequest, PresentationSchedule
+from apps.schools.models import PresentationType
+
+
+class ReminderTaskTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = CustomUser.objects.create_user(username='student1', email='student1@example.com', password='pass')
+
+        ptype, _ = PresentationType.objects.get_or_create(name='Thesis Defense')
+        self.presentation = PresentationRequest.objects.create(
+            student=self.student,
+            research_title='Test Presentation',
+            presentation_type=ptype,
+            proposed_date=timezone.now() + timezone.timedelta(minutes=15),
+            research_document='dummy.pdf',
+            presentation_slides='slides.pdf'
+        )
+        # Inside the 15-minute window of send_upcoming_reminders
+        start_time = timezone.now() + timezone.timedelta(minutes=15, seconds=20)
+        PresentationSchedule.objects.create(
+            presentation=self.presentation,
+            venue='Room 101',
+            start_time=start_time,
+            end_time=start_time + timezone.timedelta(hours=1)
+        )
+        self.lock_key = tasks._reminder_lock_key(str(self.presentation.id), 15)
+
+    @patch('apps.notifications.tasks.send_one_reminder.delay')
+    def test_beat_claims_presentation_once(self, mock_delay):
+        tasks.send_upcoming_reminders(15)
+        tasks.send_upcoming_reminders(15)
+
+        mock_delay.assert_called_once_with(str(self.presentation.id), 15)
+        self.assertTrue(cache.get(self.lock_key))
+
+    def test_beat_releases_claim_when_queueing_fails(self):
+        with patch('apps.notifications.tasks.send_one_reminder.delay', side_effect=ConnectionError):
+            with self.assertLogs('apps.notifications.tasks', level='ERROR'):
+                tasks.send_upcoming_reminders(15)
+        self.assertIsNone(cache.get(self.lock_key))
+
+        with patch('apps.notifications.tasks.send_one_reminder.delay') as mock_delay:
+            tasks.send_upcoming_reminders(15)
+        mock_delay.assert_called_once_with(str(self.presentation.id), 15)
+
+    @patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=OSError('mail server down'))
+    def test_unreachable_mail_server_is_retried_before_anything_is_sent(self, mock_open):
+        cache.add(self.lock_key, True)
+
+        with self.assertLogs('apps.notifications.tasks', level='WARNING'):
+            result = tasks.send_one_reminder.apply(args=(str(self.presentation.id), 15))
+
+        self.assertEqual(result.state, 'FAILURE')
+        self.assertEqual(mock_open.call_count, tasks.REMINDER_MAX_RETRIES + 1)
+        self.assertFalse(Notification.objects.exists())
+        # Out of retries: the beat task may claim the presentation again
+        self.assertIsNone(cache.get(self.lock_key))
+
+    def test_database_error_is_retried(self):
+        with patch(
+            'apps.notifications.tasks.send_presentation_reminders_to_all_actors',
+            side_effect=[DatabaseError('gone away'), None],
+        ) as mock_send:
+            with self.assertLogs('apps.notifications.tasks', level='WARNING'):
+                result = tasks.send_one_reminder.apply(args=(str(self.presentation.id), 15))
+
+        self.assertEqual(result.state, 'SUCCESS')
+        self.assertEqual(mock_send.call_count, 2)
+
+    def test_reminder_is_sent_and_logged(self):
+        result = tasks.send_one_reminder.apply(args=(str(self.presentation.id), 15))
+
+        self.assertEqual(result.state, 'SUCCESS')
+        self.assertEqual(ReminderLog.objects.filter(presentation=self.presentation, recipient=self.student).count(), 1)
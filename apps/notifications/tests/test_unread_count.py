@@ -0,0 +1,76 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.notifications.models import Notification
+from apps.notifications.utils import create_notification
+from apps.users.models import CustomUser
+
+
+class UnreadCountTests(TestCase):
+    url = '/api/notifications/notifications/unread_count/'
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='reader', email='reader@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def unread_count(self):
+        return self.client.get(self.url).data['unread_count']
+
+    def notify(self, title='Hello'):
+        # Cached counts are dropped once the change commits
+        with self.captureOnCommitCallbacks(execute=True):
+            return create_notification(self.user, title, 'message', 'system_announcement')
+
+    def test_count_is_served_from_cache_between_polls(self):
+        self.notify()
+        self.assertEqual(self.unread_count(), 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.unread_count(), 1)
+
+    def test_new_notification_invalidates_count(self):
+        self.assertEqual(self.unread_count(), 0)
+
+        self.notify()
+
+        self.assertEqual(self.unread_count(), 1)
+
+    def test_mark_read_invalidates_count(self):
+        notification = self.notify()
+        self.assertEqual(self.unread_count(), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/notifications/notifications/{notification.pk}/mark_read/')
+
+        self.assertEqual(self.unread_count(), 0)
+
+    def test_mark_all_read_invalidates_count(self):
+        self.notify('one')
+        self.notify('two')
+        self.assertEqual(self.unread_count(), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/notifications/notifications/mark_all_read/')
+
+        self.assertEqual(self.unread_count(), 0)
+        self.assertFalse(Notification.objects.filter(recipient=self.user, is_read=False).exists())
+
+    def test_count_is_kept_until_the_change_commits(self):
+        self.assertEqual(self.unread_count(), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_notification(self.user, 'Hello', 'message', 'system_announcement')
+            # Not committed yet: a recount here could cache the old state
+            self.assertEqual(self.unread_count(), 0)
+
+        self.assertEqual(self.unread_count(), 1)
+
+    def test_list_includes_unread_count(self):
+        self.notify()
+
+        response = self.client.get('/api/notifications/notifications/')
+
+        self.assertEqual(response.data['unread_count'], 1)
@@ -1,9 +1,18 @@
 import logging
+import re
+from contextlib import contextmanager
 from django.conf import settings
 from django.template.loader import render_to_string
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.dummy import EmailBackend as DummyEmailBackend
 from django.contrib.contenttypes.models import ContentType
-from apps.notifications.models import Notification, ReminderLog
+from django.db import transaction
+from django.db.models import Prefetch
+from django.db.models.signals import post_save
+from apps.notifications.models import BULK_BATCH_SIZE, Notification, ReminderLog
+from apps.presentations.models import (
+    ExaminerAssignment, PresentationRequest, PresentationSchedule, SupervisorAssignment
+)
 from apps.users.models import CustomUser
 
 
@@ -28,6 +37,13 @@ def create_notification(recipient, title, message, notification_type, obj=None,
     Returns:
         Notification object
     """
+    notification = _build_notification(recipient, title, message, notification_type, obj, related_user, priority)
+    notification.save(force_insert=True)
+    return notification
+
+
+def _build_notification(recipient, title, message, notification_type, obj=None, related_user=None, priority=0):
+    """Unsaved Notification with the fields create_notification() sets"""
     kwargs = {
         'recipient': recipient,
         'title': title,
@@ -39,37 +55,83 @@ def create_notification(recipient, title, message, notification_type, obj=None,
     if obj:
         kwargs['content_type'] = ContentType.objects.get_for_model(obj)
         kwargs['object_id'] = obj.id
-    return Notification.objects.create(**kwargs)
+    return Notification(**kwargs)
+
+
+def _build_notifications(recipients, title, message, notification_type, obj=None, related_user=None, priority=0):
+    """
+    Unsaved copies of one notification for each recipient, for
+    _bulk_create_notifications(). obj's ContentType is resolved once for all.
+    """
+    link = {}
+    if obj:
+        link = {'content_type': ContentType.objects.get_for_model(obj), 'object_id': obj.id}
+    return [
+        Notification(
+            recipient=recipient,
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            related_user=related_user,
+            priority=priority,
+            **link
+        )
+        for recipient in recipients
+    ]
+
+
+def _bulk_create_notifications(notifications):
+    """
+    Save unsaved notifications with batched INSERTs.
+
+    bulk_create() skips post_save, so it is sent for each notification once they
+    are all inserted, just as Notification.objects.create() would have; the
+    blockchain audit trail records notifications from that signal.
+    """
+    with transaction.atomic():
+        notifications = Notification.objects.bulk_create(notifications, batch_size=BULK_BATCH_SIZE)
+        for notification in notifications:
+            post_save.send(
+                sender=Notification, instance=notification, created=True,
+                update_fields=None, raw=False, using=notification._state.db,
+            )
+    return notifications
 
 
 # -------------------------------
 # Honorific helper
 # -------------------------------
+# User attributes that may hold a title, in order of preference
+_TITLE_ATTRS = ('title_display', 'title', 'academic_title', 'honorific')
+
+# Undotted titles normalised to their abbreviation, by lowercase prefix
+_TITLE_HONORIFICS = (('dr', 'Dr.'), ('prof', 'Prof.'))
+
+# Full names starting with Dr / Dr. or Prof / Prof. / Professor
+_HONORIFIC_NAME_RE = re.compile(r'(Dr|Prof)')
+
+
 def _get_honorific(user):
     if not user:
         return 'Mr/Ms'
 
-    for attr in ('title_display', 'title', 'academic_title', 'honorific'):
+    for attr in _TITLE_ATTRS:
         val = getattr(user, attr, None)
         if val:
             s = str(val).strip()
-            if s.lower().startswith('dr') and not s.endswith('.'):
-                return 'Dr.'
-            if s.lower().startswith('prof') and not s.endswith('.'):
-                return 'Prof.'
+            if not s.endswith('.'):
+                lowered = s.lower()
+                for prefix, honorific in _TITLE_HONORIFICS:
+                    if lowered.startswith(prefix):
+                        return honorific
             return s
 
-    try:
-        full = user.get_full_name() if callable(getattr(user, 'get_full_name', None)) else ''
-    except Exception:
-        full = ''
+    get_full_name = getattr(user, 'get_full_name', None)
+    full = get_full_name() if callable(get_full_name) else ''
 
-    if full:
-        for p in ('Dr.', 'Dr', 'Prof.', 'Prof', 'Professor'):
-            if full.startswith(p):
-                if p.startswith('Dr'):
-                    return 'Dr.'
-                return 'Prof.'
+    match = _HONORIFIC_NAME_RE.match(full) if full else None
+    if match:
+        return 'Dr.' if match.group(1) == 'Dr' else 'Prof.'
 
     return 'Mr/Ms'
 
@@ -84,30 +146,28 @@ def create_notification_for_students(title, message, notification_type, obj=None
     """
     students = CustomUser.objects.filter(
         is_active=True,
-        studentprofile__isnull=False,
-        studentprofile__is_active_student=True
-    ).distinct()
-
-    notifications = []
-    for student in students:
-        n = create_notification(
-            recipient=student,
-            title=title,
-            message=message,
-            notification_type=notification_type,
-            obj=obj,
-            related_user=related_user,
-            priority=priority
-        )
-        notifications.append(n)
-    return notifications
+        student_profile__isnull=False,
+        student_profile__is_active_student=True
+    ).distinct().only('id')
+
+    return _bulk_create_notifications(_build_notifications(
+        students,
+        title=title,
+        message=message,
+        notification_type=notification_type,
+        obj=obj,
+        related_user=related_user,
+        priority=priority
+    ))
 
 
 def create_notification_for_user(recipient, title, message, notification_type, obj=None, related_user=None, priority=0):
     """
     Create a notification for a single student user.
     """
-    if not hasattr(recipient, 'studentprofile') or not recipient.studentprofile.is_active_student:
+    # One lookup, none if the profile was select_related
+    profile = getattr(recipient, 'student_profile', None)
+    if profile is None or not profile.is_active_student:
         return None
 
     return create_notification(
@@ -124,17 +184,19 @@ def create_notification_for_user(recipient, title, message, notification_type, o
 # -------------------------------
 # Presentation-specific notifications
 # -------------------------------
+_PRESENTATION_NOTIFICATION_TITLES = {
+    'presentation_accepted': 'Presentation Request Accepted',
+    'presentation_declined': 'Presentation Request Declined',
+    'date_changed': 'Presentation Date Changed',
+    'time_warning': 'Presentation Starting Soon',
+    'assessment_submitted': 'Assessment Submitted',
+    'presentation_completed': 'Presentation Completed',
+    'presentation_reminder': 'Presentation Reminder'
+}
+
+
 def send_presentation_notification(presentation_request, notification_type, custom_message=None):
-    titles = {
-        'presentation_accepted': 'Presentation Request Accepted',
-        'presentation_declined': 'Presentation Request Declined',
-        'date_changed': 'Presentation Date Changed',
-        'time_warning': 'Presentation Starting Soon',
-        'assessment_submitted': 'Assessment Submitted',
-        'presentation_completed': 'Presentation Completed',
-        'presentation_reminder': 'Presentation Reminder'
-    }
-    title = titles.get(notification_type, 'Presentation Update')
+    title = _PRESENTATION_NOTIFICATION_TITLES.get(notification_type, 'Presentation Update')
     message = custom_message or f'Update on your presentation request: {presentation_request.research_title}'
     return create_notification_for_user(
         recipient=presentation_request.student,
@@ -159,13 +221,7 @@ def send_examiner_assignment_notification(examiner, presentation_request, assign
     )
 
     # Email sending (best-effort)
-    _send_email(recipient=examiner, subject=title, message=message, template_prefix='examiner_assignment', context={
-        'presentation': presentation_request,
-        'examiner': examiner,
-        'assigned_by': assigned_by,
-        'frontend_url': getattr(settings, 'FRONTEND_URL', 'http://localhost:4200'),
-        'honorific': _get_honorific(examiner)
-    })
+    _queue_assignment_email('examiner_assignment', 'examiner', examiner, presentation_request, assigned_by, title, message)
 
     return n
 
@@ -206,47 +262,39 @@ def send_presentation_submitted_notification(presentation_request):
         user_groups__name='coordinator',
         is_active=True,
         is_approved=True
-    ).distinct()
-
-    notifications = []
-    for coordinator in coordinators:
-        n = create_notification(
-            recipient=coordinator,
-            title='New Presentation Request',
-            message=f'{presentation_request.student.get_full_name()} submitted a new presentation: "{presentation_request.research_title}"',
-            notification_type='presentation_request',
-            obj=presentation_request,
-            related_user=presentation_request.student
-        )
-        notifications.append(n)
-    return notifications
+    ).distinct().only('id')
 
-
-def send_presentation_completed_notification(presentation_request, coordinator):
-    notifications = []
-
-    # Notify student
-    n1 = create_notification(
-        recipient=presentation_request.student,
-        title='Presentation Completed',
-        message=f'Your presentation "{presentation_request.research_title}" has been completed.',
-        notification_type='presentation_completed',
-        obj=presentation_request
-    )
-    notifications.append(n1)
-
-    # Notify coordinator
-    n2 = create_notification(
-        recipient=coordinator,
-        title='Presentation Completed',
-        message=f'The presentation "{presentation_request.research_title}" by {presentation_request.student.get_full_name()} has been completed.',
-        notification_type='presentation_completed',
+    message = f'{presentation_request.student.get_full_name()} submitted a new presentation: "{presentation_request.research_title}"'
+    return _bulk_create_notifications(_build_notifications(
+        coordinators,
+        title='New Presentation Request',
+        message=message,
+        notification_type='presentation_request',
         obj=presentation_request,
         related_user=presentation_request.student
-    )
-    notifications.append(n2)
+    ))
 
-    return notifications
+
+def send_presentation_completed_notification(presentation_request, coordinator):
+    return _bulk_create_notifications([
+        # Notify student
+        _build_notification(
+            recipient=presentation_request.student,
+            title='Presentation Completed',
+            message=f'Your presentation "{presentation_request.research_title}" has been completed.',
+            notification_type='presentation_completed',
+            obj=presentation_request
+        ),
+        # Notify coordinator
+        _build_notification(
+            recipient=coordinator,
+            title='Presentation Completed',
+            message=f'The presentation "{presentation_request.research_title}" by {presentation_request.student.get_full_name()} has been completed.',
+            notification_type='presentation_completed',
+            obj=presentation_request,
+            related_user=presentation_request.student
+        ),
+    ])
 
 # -------------------------------
 def send_supervisor_assignment_notification(supervisor, presentation_request, assigned_by):
@@ -270,20 +318,7 @@ def send_supervisor_assignment_notification(supervisor, presentation_request, as
     )
 
     # Optional: send email
-    _send_email(
-        recipient=supervisor,
-        subject=title,
-        message=message,
-        template_prefix='supervisor_assignment',
-        context={
-            'presentation': presentation_request,
-            'supervisor': supervisor,
-            'assigned_by': assigned_by,
-            'presentation_type': pres_type_name,
-            'frontend_url': getattr(settings, 'FRONTEND_URL', 'http://localhost:4200'),
-            'honorific': _get_honorific(supervisor)
-        }
-    )
+    _queue_assignment_email('supervisor_assignment', 'supervisor', supervisor, presentation_request, assigned_by, title, message)
 
     return notification
 
@@ -307,140 +342,304 @@ def send_session_moderator_assignment_notification(moderator, presentation_reque
         related_user=assigned_by
     )
 
+    _queue_assignment_email(
+        'session_moderator_assignment', 'moderator', moderator, presentation_request, assigned_by, title, message
+    )
+
+    return notification
+
+
+# -------------------------------
+def dispatch_email_task(task_name, *args):
+    """
+    Run the notifications email task task_name(*args) in a Celery worker once
+    the current transaction commits, so the request does not wait on SMTP. The
+    task runs in-process instead when NOTIFICATION_ASYNC_EMAIL is off or it
+    cannot be queued. args must be JSON-serializable (ids, not model instances).
+    """
+    def dispatch():
+        # Imported here: the tasks module imports this one
+        from apps.notifications import tasks
+        task = getattr(tasks, task_name)
+        if getattr(settings, 'NOTIFICATION_ASYNC_EMAIL', True):
+            try:
+                task.delay(*args)
+                return
+            except Exception:
+                logger.exception('Could not queue %s, running it synchronously', task_name)
+        task(*args)
+
+    transaction.on_commit(dispatch)
+
+
+def _queue_assignment_email(template_prefix, role_key, recipient, presentation_request, assigned_by, subject, message):
+    """Send an assignment email through the send_assignment_email task"""
+    dispatch_email_task(
+        'send_assignment_email',
+        template_prefix, role_key, str(recipient.pk), str(presentation_request.pk),
+        str(assigned_by.pk) if assigned_by else None, subject, message,
+    )
+
+
+def deliver_assignment_email(template_prefix, role_key, recipient, presentation_request, assigned_by, subject, message):
+    """
+    Send an examiner / supervisor / session moderator assignment email using the
+    ``<template_prefix>`` templates, which address the recipient as ``role_key``.
+    """
     _send_email(
-        recipient=moderator,
-        subject=title,
+        recipient=recipient,
+        subject=subject,
         message=message,
-        template_prefix='session_moderator_assignment',
+        template_prefix=template_prefix,
         context={
             'presentation': presentation_request,
-            'moderator': moderator,
+            role_key: recipient,
             'assigned_by': assigned_by,
+            'presentation_type': getattr(presentation_request.presentation_type, 'name', 'Presentation'),
             'frontend_url': getattr(settings, 'FRONTEND_URL', 'http://localhost:4200'),
-            'honorific': _get_honorific(moderator)
+            'honorific': _get_honorific(recipient)
         }
     )
 
-    return notification
-
 
 # -------------------------------
 
-def send_presentation_time_reminder(presentation_request, minutes_before=30):
+def send_presentation_time_reminder(presentation_request, minutes_before=30, connection=None):
     """
     Send a reminder notification AND email to a single recipient (the student).
     Kept for backward-compatibility; prefer send_presentation_reminders_to_all_actors().
+
+    presentation_request may also be a PresentationRequest id, which is loaded
+    through with_reminder_relations(). Pass a connection from
+    reminder_mail_connection() when reminding several students in a row.
     """
+    if not isinstance(presentation_request, PresentationRequest):
+        presentation_request = with_reminder_relations(PresentationRequest.objects).get(pk=presentation_request)
+
     return _send_reminder_to_recipient(
         presentation_request,
         recipient=presentation_request.student,
         role_label='Presenter',
         minutes_before=minutes_before,
+        connection=connection,
     )
 
 
-def send_presentation_reminders_to_all_actors(presentation_request, minutes_before=30):
+# PresentationRequest fields read when sending reminders, see with_reminder_relations()
+REMINDER_PRESENTATION_FIELDS = (
+    'id', 'research_title', 'proposed_date', 'meeting_link', 'student', 'schedule', 'assignment',
+)
+
+
+def presentations_starting_between(window_start, window_end):
+    """
+    PresentationRequests starting in [window_start, window_end), going by
+    PresentationSchedule.start_time or PresentationRequest.actual_date.
+
+    The two range scans are combined with a SQL UNION, which also removes
+    duplicates, inside an id__in subquery: a single round-trip where each side
+    can use its own index.
+    """
+    scheduled_ids = PresentationSchedule.objects.filter(
+        start_time__gte=window_start, start_time__lt=window_end
+    ).order_by().values_list('presentation_id', flat=True)
+    actual_ids = PresentationRequest.objects.filter(
+        actual_date__gte=window_start, actual_date__lt=window_end
+    ).order_by().values_list('id', flat=True)
+    return PresentationRequest.objects.filter(id__in=scheduled_ids.union(actual_ids))
+
+
+def with_reminder_relations(presentations):
+    """
+    Load everything send_presentation_reminders_to_all_actors() and the reminder
+    email templates read from a PresentationRequest queryset: student, schedule,
+    assignment, session moderator, supervisors and examiners.
+
+    Only the PresentationRequest columns the reminders use are selected, the
+    rest (abstract, documents, review notes, ...) stay deferred.
+    """
+    return presentations.only(
+        *REMINDER_PRESENTATION_FIELDS
+    ).select_related(
+        'student', 'schedule', 'assignment__session_moderator'
+    ).prefetch_related(
+        Prefetch(
+            'assignment__supervisor_assignments',
+            queryset=SupervisorAssignment.objects.select_related('supervisor')
+        ),
+        Prefetch(
+            'assignment__examiner_assignments',
+            queryset=ExaminerAssignment.objects.select_related('examiner')
+        ),
+    )
+
+
+@contextmanager
+def reminder_mail_connection():
+    """
+    Open one mail connection to send a run of reminder emails over. If it cannot
+    be opened up front, each email opens its own connection as usual.
+    """
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception:
+        logger.exception('Failed to open a shared mail connection for reminders')
+    try:
+        yield connection
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            logger.exception('Failed to close the shared mail connection for reminders')
+
+
+def send_presentation_reminders_to_all_actors(presentation_request, minutes_before=30, connection=None):
     """
     Send reminder notifications + emails to **all** actors linked to this
     presentation: student, supervisors, session moderator, and examiners.
+    Someone holding several of these roles is reminded once, under the first.
+
+    Load presentations through with_reminder_relations() so the actors are read
+    from the prefetched relations instead of being queried per presentation.
+    The emails share one mail connection; pass one opened with
+    reminder_mail_connection() to share it across several presentations.
     """
-    results = []
+    if connection is None:
+        with reminder_mail_connection() as connection:
+            return send_presentation_reminders_to_all_actors(
+                presentation_request, minutes_before=minutes_before, connection=connection
+            )
+
+    # Every actor, once each under their first role
+    actors = {}
+
+    def remind(recipient, role_label):
+        if recipient is not None:
+            actors.setdefault(recipient.pk, (recipient, role_label))
 
     # 1. Student (presenter)
-    results.append(
-        _send_reminder_to_recipient(
-            presentation_request,
-            recipient=presentation_request.student,
-            role_label='Presenter',
-            minutes_before=minutes_before,
-        )
-    )
+    remind(presentation_request.student, 'Presenter')
 
     # 2. Supervisors (from assignment)
     try:
         assignment = presentation_request.assignment
-        for sa in assignment.supervisor_assignments.select_related('supervisor').all():
-            results.append(
-                _send_reminder_to_recipient(
-                    presentation_request,
-                    recipient=sa.supervisor,
-                    role_label='Supervisor',
-                    minutes_before=minutes_before,
-                )
-            )
+        for sa in assignment.supervisor_assignments.all():
+            remind(sa.supervisor, 'Supervisor')
     except Exception:
         logger.debug('No assignment / supervisors for presentation %s', presentation_request.id)
 
     # 3. Session moderator
     try:
-        moderator = presentation_request.assignment.session_moderator
-        if moderator:
-            results.append(
-                _send_reminder_to_recipient(
-                    presentation_request,
-                    recipient=moderator,
-                    role_label='Session Moderator',
-                    minutes_before=minutes_before,
-                )
-            )
+        remind(presentation_request.assignment.session_moderator, 'Session Moderator')
     except Exception:
         logger.debug('No moderator for presentation %s', presentation_request.id)
 
     # 4. Examiners (from assignment)
     try:
         assignment = presentation_request.assignment
-        for ea in assignment.examiner_assignments.select_related('examiner').all():
-            results.append(
-                _send_reminder_to_recipient(
-                    presentation_request,
-                    recipient=ea.examiner,
-                    role_label='Examiner',
-                    minutes_before=minutes_before,
-                )
-            )
+        for ea in assignment.examiner_assignments.all():
+            remind(ea.examiner, 'Examiner')
     except Exception:
         logger.debug('No examiners for presentation %s', presentation_request.id)
 
+    # In-app notifications for every actor, committed together before any email goes out
+    results = _bulk_create_notifications([
+        _build_reminder_notification(presentation_request, recipient, role_label, minutes_before)
+        for recipient, role_label in actors.values()
+    ])
+
+    # The presentation details block is the same in every actor's email
+    details = _render_reminder_details(presentation_request)
+    for notification, (recipient, role_label) in zip(results, actors.values()):
+        _send_reminder_email(
+            presentation_request, recipient, role_label, minutes_before, notification.title, notification.message,
+            details=details, connection=connection,
+        )
+
+    # One batched insert for the reminder logs of every actor. The emails are
+    # already out, so a failure here must not make the caller retry the send
+    try:
+        ReminderLog.log_bulk(
+            presentation_request,
+            [recipient for recipient, _ in actors.values()],
+            minutes_before=minutes_before,
+            channel='email',
+        )
+    except Exception:
+        logger.exception('Failed to log reminders for presentation id %s', presentation_request.id)
+
     return results
 
 
 # ---- internal helper to avoid duplication ----
-def _send_reminder_to_recipient(presentation_request, recipient, role_label, minutes_before):
+def _render_reminder_details(presentation_request):
+    """
+    Render the presentation details fragments of the ``presentation_reminder``
+    emails once, for reuse across all recipients of the same presentation.
+    """
+    context = {'presentation': presentation_request}
+    try:
+        return {
+            'details_html': render_to_string('emails/presentation_reminder_details.html', context),
+            'details_text': render_to_string('emails/presentation_reminder_details.txt', context),
+        }
+    except Exception:
+        # The reminder templates include the fragments themselves
+        logger.exception('Failed to render reminder details for presentation id %s', presentation_request.id)
+        return {}
+
+
+def _send_reminder_to_recipient(presentation_request, recipient, role_label, minutes_before, connection=None):
     """
     Create an in-app notification, log the reminder, and send an email to ONE
-    recipient using the ``presentation_reminder`` template.
+    recipient using the ``presentation_reminder`` template. connection is the
+    mail connection to send over, by default a new one.
     """
-    title = "Presentation Starting Soon"
-    message = (
-        f"The presentation '{presentation_request.research_title}' "
-        f"will start in {minutes_before} minutes.  You are listed as: {role_label}."
+    # In-app notification (built like create_notification() so it works for
+    # non-student recipients too — create_notification_for_user guards on
+    # student_profile which staff don't have).
+    notification = _build_reminder_notification(presentation_request, recipient, role_label, minutes_before)
+    notification.save(force_insert=True)
+
+    # Reminder log
+    ReminderLog.log_bulk(presentation_request, [recipient], minutes_before=minutes_before, channel='email')
+
+    # Email (best-effort)
+    _send_reminder_email(
+        presentation_request, recipient, role_label, minutes_before, notification.title, notification.message,
+        connection=connection,
     )
 
-    # In-app notification (uses create_notification directly so it works for
-    # non-student recipients too — create_notification_for_user guards on
-    # studentprofile which staff don't have).
-    notification = create_notification(
+    return notification
+
+
+def _build_reminder_notification(presentation_request, recipient, role_label, minutes_before):
+    """Unsaved ``time_warning`` notification reminding recipient of the presentation"""
+    return _build_notification(
         recipient=recipient,
-        title=title,
-        message=message,
+        title="Presentation Starting Soon",
+        message=(
+            f"The presentation '{presentation_request.research_title}' "
+            f"will start in {minutes_before} minutes.  You are listed as: {role_label}."
+        ),
         notification_type='time_warning',
         obj=presentation_request,
     )
 
-    # Reminder log
-    ReminderLog.objects.create(
-        recipient=recipient,
-        presentation=presentation_request,
-        minutes_before=minutes_before,
-        channel='email',
-        status='sent',
-    )
 
-    # Email (best-effort)
+def _send_reminder_email(
+    presentation_request, recipient, role_label, minutes_before, subject, message, details=None, connection=None
+):
+    """
+    Email the ``presentation_reminder`` template to recipient, logging failures.
+    Pass the result of _render_reminder_details() as details when sending to
+    several recipients of the same presentation.
+    """
     try:
         _send_email(
             recipient=recipient,
-            subject=title,
+            subject=subject,
             message=message,
             template_prefix='presentation_reminder',
             context={
@@ -450,7 +649,9 @@ def _send_reminder_to_recipient(presentation_request, recipient, role_label, min
                 'minutes_before': minutes_before,
                 'frontend_url': getattr(settings, 'FRONTEND_URL', 'http://localhost:4200'),
                 'honorific': _get_honorific(recipient),
+                **(details or {}),
             },
+            connection=connection,
         )
     except Exception:
         logger.exception(
@@ -459,14 +660,24 @@ def _send_reminder_to_recipient(presentation_request, recipient, role_label, min
             getattr(recipient, 'email', None),
         )
 
-    return notification
-
 # -------------------------------
 # Helper for sending emails
 # -------------------------------
-def _send_email(recipient, subject, message, template_prefix=None, context=None):
+def _send_email(recipient, subject, message, template_prefix=None, context=None, connection=None):
     try:
         logger.debug('Preparing email: recipient=%s subject=%s template=%s', getattr(recipient, 'email', None), subject, template_prefix)
+        to_emails = [recipient.email] if getattr(recipient, 'email', None) else []
+
+        if not to_emails:
+            logger.warning('Not sending email: recipient has no email address (recipient=%s)', getattr(recipient, 'id', None))
+            return
+
+        # The dummy backend discards every message, so there is nothing to render
+        connection = connection or get_connection()
+        if isinstance(connection, DummyEmailBackend):
+            logger.debug('Not rendering email: the dummy email backend is configured')
+            return
+
         html_body = None
         text_body = message
 
@@ -481,14 +692,8 @@ def _send_email(recipient, subject, message, template_prefix=None, context=None)
                 text_body = message
 
         from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', 'no-reply@spms.edu')
-        to_emails = [recipient.email] if getattr(recipient, 'email', None) else []
-
-        if not to_emails:
-            logger.warning('Not sending email: recipient has no email address (recipient=%s)', getattr(recipient, 'id', None))
-            return
-
         logger.debug('Email from=%s to=%s; html_body=%s text_body_len=%d', from_email, to_emails, bool(html_body), len(text_body or ''))
-        msg = EmailMultiAlternatives(subject, text_body, from_email, to_emails)
+        msg = EmailMultiAlternatives(subject, text_body, from_email, to_emails, connection=connection)
         if html_body:
             msg.attach_alternative(html_body, 'text/html')
         msg.send(fail_silently=False)
@@ -503,8 +708,6 @@ def send_exam_officer_decision_notification(presentation_request, exam_officer,
     Notify relevant parties about the examination officer's decision.
     Notifies: student, coordinator, supervisors.
     """
-    notifications = []
-    
     if decision == 'approved':
         title = 'Presentation Approved by Examination Officer'
         student_msg = f'Your presentation "{presentation_request.research_title}" has been approved by the Examination Officer.'
@@ -516,15 +719,16 @@ def send_exam_officer_decision_notification(presentation_request, exam_officer,
         student_msg += f'\nComments: {comments}'
     
     # Notify student
-    n = create_notification(
-        recipient=presentation_request.student,
-        title=title,
-        message=student_msg,
-        notification_type='exam_officer_decision',
-        obj=presentation_request,
-        related_user=exam_officer
-    )
-    notifications.append(n)
+    notifications = [
+        _build_notification(
+            recipient=presentation_request.student,
+            title=title,
+            message=student_msg,
+            notification_type='exam_officer_decision',
+            obj=presentation_request,
+            related_user=exam_officer
+        )
+    ]
     
     # Notify coordinator
     try:
@@ -538,44 +742,41 @@ def send_exam_officer_decision_notification(presentation_request, exam_officer,
             if comments:
                 coord_msg += f'\nComments: {comments}'
             
-            n2 = create_notification(
+            notifications.append(_build_notification(
                 recipient=assignment.coordinator,
                 title=title,
                 message=coord_msg,
                 notification_type='exam_officer_decision',
                 obj=presentation_request,
                 related_user=exam_officer
-            )
-            notifications.append(n2)
+            ))
     except Exception as e:
         print(f"Failed to notify coordinator: {e}")
     
     # Notify supervisors
-    for supervisor in presentation_request.supervisors.all():
-        try:
-            sup_msg = (
-                f'Examination Officer has {decision} the presentation '
-                f'"{presentation_request.research_title}" by {presentation_request.student.get_full_name()}.'
-            )
-            n3 = create_notification(
-                recipient=supervisor,
-                title=title,
-                message=sup_msg,
-                notification_type='exam_officer_decision',
-                obj=presentation_request,
-                related_user=exam_officer
-            )
-            notifications.append(n3)
-        except Exception as e:
-            print(f"Failed to notify supervisor: {e}")
+    sup_msg = (
+        f'Examination Officer has {decision} the presentation '
+        f'"{presentation_request.research_title}" by {presentation_request.student.get_full_name()}.'
+    )
+    notifications += _build_notifications(
+        presentation_request.supervisors.all(),
+        title=title,
+        message=sup_msg,
+        notification_type='exam_officer_decision',
+        obj=presentation_request,
+        related_user=exam_officer
+    )
     
-    return notifications
+    return _bulk_create_notifications(notifications)
 
 
-def send_evaluation_reminder_notification(examiner, presentation_request, requested_by):
+def send_evaluation_reminder_notification(examiner, presentation_request, requested_by, log=True):
     """
     Send a reminder to an examiner to submit their evaluation form for a presentation.
     Sends both in-app notification and email.
+
+    Pass log=False when reminding several examiners and write their ReminderLog
+    rows with a single ReminderLog.log_bulk() call afterwards.
     """
     title = 'Evaluation Submission Reminder'
     message = (
@@ -599,19 +800,13 @@ def send_evaluation_reminder_notification(examiner, presentation_request, reques
 
     # Send email
     subject = f'[SPMS] Reminder: Submit Evaluation for "{presentation_request.research_title}"'
-    _send_email(examiner, subject, message)
+    dispatch_email_task('send_plain_email', str(examiner.pk), subject, message)
 
     # Log the reminder
-    try:
-        from apps.notifications.models import ReminderLog
-        ReminderLog.objects.create(
-            recipient=examiner,
-            presentation=presentation_request,
-            minutes_before=0,
-            channel='email',
-            status='sent'
-        )
-    except Exception as e:
-        logger.warning('Failed to log evaluation reminder: %s', e)
+    if log:
+        try:
+            ReminderLog.log_bulk(presentation_request, [examiner], minutes_before=0, channel='email')
+        except Exception as e:
+            logger.warning('Failed to log evaluation reminder: %s', e)
 
     return notification
@@ -1,15 +1,20 @@
+from django.core.cache import cache
 from django.db.models import Q
 from django.utils import timezone
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Notification, NotificationPreference
+from .models import (
+    UNREAD_COUNT_CACHE_TIMEOUT, Notification, NotificationPreference,
+    forget_unread_count, unread_count_cache_key,
+)
 from .serializers import NotificationSerializer, NotificationPreferenceSerializer
-from .utils import send_presentation_reminders_to_all_actors
-from apps.presentations.models import PresentationRequest, PresentationSchedule
+from .utils import dispatch_email_task, presentations_starting_between
+from apps.presentations.models import PresentationRequest
 
 
 class NotificationPreferenceViewSet(viewsets.ModelViewSet):
@@ -33,15 +38,35 @@ class NotificationViewSet(viewsets.ModelViewSet):
                 recipient=self.request.user,
                 is_archived=False
             )
-            .select_related('recipient', 'related_user', 'content_type')
+            # Everything NotificationSerializer reads; content types come from their cache
+            .select_related(
+                'recipient', 'related_user', 'related_user__school', 'related_user__programme'
+            )
             .order_by('-created_at')
         )
 
+    def get_unread_count(self):
+        # Served from the cache between polls; notification signals drop the key
+        key = unread_count_cache_key(self.request.user.id)
+        count = cache.get(key)
+        if count is None:
+            # Bare COUNT on the (recipient, is_read) index, without the list's joins
+            count = Notification.objects.filter(
+                recipient=self.request.user, is_archived=False, is_read=False
+            ).count()
+            cache.set(key, count, UNREAD_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        # Ship the badge count with each page so the client can skip unread_count
+        if isinstance(response.data, dict):
+            response.data['unread_count'] = self.get_unread_count()
+        return response
+
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
-        return Response({
-            'unread_count': self.get_queryset().filter(is_read=False).count()
-        })
+        return Response({'unread_count': self.get_unread_count()})
 
     @action(detail=True, methods=['post'])
     def mark_read(self, request, pk=None):
@@ -51,18 +76,15 @@ class NotificationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
-        updated = self.get_queryset().filter(is_read=False).update(
-            is_read=True,
-            read_at=timezone.now()
-        )
+        updated = self.get_queryset().mark_read()
+        forget_unread_count(request.user.id)
         return Response({'updated': updated})
 
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], pagination_class=LimitOffsetPagination)
     def aggregated_from_presentations(self, request):
-        # Simply return all notifications for this user
-        notifications = self.get_queryset()
-        serializer = self.get_serializer(notifications, many=True)
-        return Response(serializer.data)
+        # One ?limit=/?offset= page of this user's notifications (PAGE_SIZE by default)
+        page = self.paginate_queryset(self.get_queryset())
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
 
 # --------
 class SendReminderView(APIView):
@@ -77,6 +99,9 @@ class SendReminderView(APIView):
 
         Otherwise fall back to the time-window sweep (presentations
         starting within `minutes` from now).
+
+        Each presentation's reminders are sent by a send_one_reminder task,
+        so the response does not wait on SMTP.
         """
         presentation_id = request.data.get('presentation_id')
         minutes = request.data.get('minutes', 15)
@@ -88,13 +113,13 @@ class SendReminderView(APIView):
         # ---- Force-send for a specific presentation ----
         if presentation_id:
             try:
-                pr = PresentationRequest.objects.select_related('student').get(id=presentation_id)
+                pr = PresentationRequest.objects.only('id').get(id=presentation_id)
             except PresentationRequest.DoesNotExist:
                 return Response(
                     {"detail": "Presentation not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            send_presentation_reminders_to_all_actors(pr, minutes_before=minutes)
+            dispatch_email_task('send_one_reminder', str(pr.id), minutes)
             return Response({"status": "reminders sent", "count": 1})
 
         # ---- Fallback: time-window sweep ----
@@ -102,21 +127,10 @@ class SendReminderView(APIView):
         window_start = now + timezone.timedelta(minutes=minutes)
         window_end = window_start + timezone.timedelta(seconds=59)
 
-        schedule_pr_ids = list(
-            PresentationSchedule.objects
-            .filter(start_time__gte=window_start, start_time__lt=window_end)
-            .values_list('presentation_id', flat=True)
-        )
-        actual_pr_ids = list(
-            PresentationRequest.objects
-            .filter(actual_date__gte=window_start, actual_date__lt=window_end)
-            .values_list('id', flat=True)
-        )
-        all_ids = set(schedule_pr_ids) | set(actual_pr_ids)
-
+        presentation_ids = presentations_starting_between(window_start, window_end).values_list('id', flat=True)
         total = 0
-        for pr in PresentationRequest.objects.filter(id__in=all_ids).select_related('student'):
-            send_presentation_reminders_to_all_actors(pr, minutes_before=minutes)
+        for pr_id in presentation_ids:
+            dispatch_email_task('send_one_reminder', str(pr_id), minutes)
             total += 1
 
         return Response({"status": "reminders sent", "count": total})
@@ -137,18 +151,15 @@ class BulkSessionReminderView(APIView):
 
         # Get all scheduled presentations (upcoming)
         now = timezone.now()
-        scheduled = PresentationRequest.objects.filter(
+        scheduled_ids = PresentationRequest.objects.filter(
             status='scheduled',
             scheduled_date__gte=now
-        ).select_related('student')
+        ).values_list('id', flat=True)
 
         total = 0
-        for pr in scheduled:
-            try:
-                send_presentation_reminders_to_all_actors(pr, minutes_before=0)
-                total += 1
-            except Exception as e:
-                print(f"Failed to send reminders for presentation {pr.id}: {e}")
+        for pr_id in scheduled_ids:
+            dispatch_email_task('send_one_reminder', str(pr_id), 0)
+            total += 1
 
         return Response({
             'status': 'bulk reminders sent',
@@ -9,7 +9,7 @@ from .models import (
     ExaminerChangeHistory
 )
 from .models import Form as PresentationForm
-from apps.notifications.utils import send_presentation_time_reminder
+from apps.notifications.utils import dispatch_email_task
 from django.contrib import messages
 
 
@@ -21,15 +21,12 @@ class PresentationRequestAdmin(admin.ModelAdmin):
     actions = ['send_15_min_reminder', 'send_30_min_reminder']
 
     def _send_reminder_for_queryset(self, request, queryset, minutes):
-        sent = 0
-        for pr in queryset:
-            try:
-                send_presentation_time_reminder(pr, minutes_before=minutes)
-                sent += 1
-            except Exception:
-                # continue to next
-                continue
-        self.message_user(request, f'Sent reminders for {sent} presentation(s) (minutes_before={minutes})', level=messages.SUCCESS)
+        # Each reminder is sent by its own task, so the admin page returns without waiting on SMTP
+        queued = 0
+        for pr_id in queryset.values_list('id', flat=True):
+            dispatch_email_task('send_presenter_reminder', str(pr_id), minutes)
+            queued += 1
+        self.message_user(request, f'Queued reminders for {queued} presentation(s) (minutes_before={minutes})', level=messages.SUCCESS)
 
     def send_15_min_reminder(self, request, queryset):
         """Admin action: send 15-minute reminders for selected presentations"""
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-17 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("presentations", "0003_exam_officer_approval_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="presentationrequest",
+            index=models.Index(fields=["actual_date"], name="pr_actual_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="presentationschedule",
+            index=models.Index(fields=["start_time"], name="ps_start_time_idx"),
+        ),
+    ]
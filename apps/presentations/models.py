@@ -171,9 +171,24 @@ class PresentationRequest(models.Model):
         help_text="Average mark from all examiner evaluations"
     )
     
+    # Fields recorded in blockchain data (see apps.blockchain.utils.serialize_model_data)
+    BLOCKCHAIN_FIELDS = (
+        'student', 'research_title', 'presentation_type', 'status',
+        'research_document', 'presentation_slides', 'plagiarism_report',
+        'proposed_date', 'alternative_date', 'scheduled_date', 'actual_date', 'submission_date',
+        'meeting_link', 'moderator_validation_status', 'moderator_validation_comments',
+        'moderator_validated_at', 'moderator_validated_by', 'moderator_validation_count',
+        'exam_officer_status', 'exam_officer_comments', 'exam_officer_reviewed_at',
+        'exam_officer_reviewed_by', 'average_mark',
+    )
+    
     class Meta:
         db_table = 'presentation_requests'
         ordering = ['-created_at']
+        indexes = [
+            # Reminder sweeps select by actual_date window
+            models.Index(fields=['actual_date'], name='pr_actual_date_idx'),
+        ]
     
     def __str__(self):
         base = f"{self.student.get_full_name()} - {self.presentation_type.name}"
@@ -293,6 +308,9 @@ class PresentationAssignment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Fields recorded in blockchain data (see apps.blockchain.utils.serialize_model_data)
+    BLOCKCHAIN_FIELDS = ('presentation', 'coordinator', 'session_moderator', 'meeting_link', 'venue')
+    
     class Meta:
         db_table = 'presentation_assignments'
     
@@ -364,6 +382,9 @@ class ExaminerAssignment(models.Model):
     acceptance_date = models.DateTimeField(null=True, blank=True)
     decline_reason = models.TextField(blank=True, null=True)
     
+    # Fields recorded in blockchain data (see apps.blockchain.utils.serialize_model_data)
+    BLOCKCHAIN_FIELDS = ('assignment', 'examiner', 'status', 'acceptance_date', 'decline_reason')
+    
     class Meta:
         db_table = 'examiner_assignments'
         unique_together = ['assignment', 'examiner']
@@ -390,6 +411,10 @@ class PresentationSchedule(models.Model):
     
     class Meta:
         db_table = 'presentation_schedules'
+        indexes = [
+            # Reminder sweeps select by start_time window
+            models.Index(fields=['start_time'], name='ps_start_time_idx'),
+        ]
     
     def __str__(self):
         return f"Schedule for {self.presentation}"
@@ -29,6 +29,7 @@ from apps.presentations.serializers import (
 from apps.schools.models import PresentationType
 from apps.users.models import CustomUser, StudentProfile
 from apps.notifications.utils import (
+    create_notification,
     send_examiner_assignment_notification,
     send_examiner_response_notification,
     send_presentation_completed_notification,
@@ -537,15 +538,14 @@ class PresentationRequestViewSet(viewsets.ModelViewSet):
         assignment.save()
 
         # Mark related notification as read
-        from apps.notifications.models import Notification
+        from apps.notifications.models import Notification, forget_unread_count
         presentation = assignment.assignment.presentation
         try:
-            Notification.objects.filter(
+            Notification.objects.for_object(presentation).filter(
                 recipient=user,
-                presentation=presentation,
-                notification_type='supervisor_assignment',
-                is_read=False
-            ).update(is_read=True, read_at=timezone.now())
+                notification_type='supervisor_assignment'
+            ).mark_read()
+            forget_unread_count(user.id)
         except Exception as e:
             print(f"Failed to mark notification as read: {e}")
 
@@ -553,13 +553,12 @@ class PresentationRequestViewSet(viewsets.ModelViewSet):
         coordinator = assignment.assignment.coordinator
         if coordinator and response_status == 'declined':
             try:
-                from apps.notifications.models import Notification as Notif
-                Notif.objects.create(
+                create_notification(
                     recipient=coordinator,
-                    presentation=presentation,
-                    notification_type='supervisor_response',
                     title=f'Supervisor {user.get_full_name()} declined supervision',
                     message=f'{user.get_full_name()} has declined the supervision assignment for "{presentation.research_title}". Reason: {decline_reason}',
+                    notification_type='supervisor_response',
+                    obj=presentation,
                 )
             except Exception as e:
                 print(f"Failed to notify coordinator: {e}")
@@ -619,20 +618,20 @@ class PresentationRequestViewSet(viewsets.ModelViewSet):
         
         assignment.save()
         
+        presentation = assignment.assignment.presentation
+        
         # Mark the examiner's notification for this assignment as read
-        from apps.notifications.models import Notification
+        from apps.notifications.models import Notification, forget_unread_count
         try:
-            Notification.objects.filter(
+            Notification.objects.for_object(presentation).filter(
                 recipient=user,
-                presentation=presentation,
-                notification_type='examiner_assignment',
-                is_read=False
-            ).update(is_read=True, read_at=timezone.now())
+                notification_type='examiner_assignment'
+            ).mark_read()
+            forget_unread_count(user.id)
         except Exception as e:
             print(f"Failed to mark notification as read: {e}")
         
         # Send notification to coordinator about examiner's response
-        presentation = assignment.assignment.presentation
         coordinator = assignment.assignment.coordinator
         
         # Check if this is a late decline (after scheduled date)
@@ -3152,18 +3151,27 @@ class ExamOfficerApproveView(APIView):
                 )
             
             # Send reminder emails to examiners who haven't submitted
+            from apps.notifications.models import ReminderLog
             from apps.notifications.utils import send_evaluation_reminder_notification
-            sent_count = 0
+            reminded = []
             for examiner in reminder_targets:
                 try:
                     send_evaluation_reminder_notification(
                         examiner=examiner,
                         presentation_request=presentation,
-                        requested_by=user
+                        requested_by=user,
+                        log=False
                     )
-                    sent_count += 1
+                    reminded.append(examiner)
                 except Exception as e:
                     print(f"Failed to send reminder to {examiner.email}: {e}")
+            sent_count = len(reminded)
+            
+            # One batched insert for the reminder logs
+            try:
+                ReminderLog.log_bulk(presentation, reminded, minutes_before=0, channel='email')
+            except Exception as e:
+                print(f"Failed to log evaluation reminders: {e}")
             
             return Response({
                 'message': f'Reminder sent to {sent_count} examiner(s) to submit their evaluations.',
@@ -3349,7 +3357,7 @@ class PresentationSessionView(APIView):
         presentations = PresentationRequest.objects.filter(
             id__in=presentation_ids,
             status__in=['submitted', 'accepted', 'scheduled']
-        )
+        ).select_related('student', 'presentation_type')
         
         if presentations.count() != len(presentation_ids):
             return Response(
@@ -3462,13 +3470,15 @@ class PresentationSessionView(APIView):
                 }
             )
         
+        # Notify about first presentation (they can see all in the session)
+        first_presentation = presentations.first()
+        
         # Send notifications to examiners
         for examiner in examiners:
             try:
-                # Notify about first presentation (they can see all in the session)
                 send_examiner_assignment_notification(
                     examiner=examiner,
-                    presentation_request=presentations.first(),
+                    presentation_request=first_presentation,
                     assigned_by=user
                 )
             except Exception as e:
@@ -3479,7 +3489,7 @@ class PresentationSessionView(APIView):
             try:
                 send_session_moderator_assignment_notification(
                     moderator=session_moderator,
-                    presentation_request=presentations.first(),
+                    presentation_request=first_presentation,
                     assigned_by=user
                 )
             except Exception as e:
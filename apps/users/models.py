@@ -32,6 +32,9 @@ class UserGroup(models.Model):
     blockchain_hash = models.CharField(max_length=256, blank=True, null=True)
     blockchain_timestamp = models.DateTimeField(null=True, blank=True)
     
+    # Fields recorded in blockchain data (see apps.blockchain.utils.serialize_model_data)
+    BLOCKCHAIN_FIELDS = ('name', 'display_name', 'description', 'permissions', 'is_active')
+    
     class Meta:
         db_table = 'user_groups'
         ordering = ['name']
@@ -199,13 +202,24 @@ class CustomUser(AbstractUser):
     
     objects = CustomUserManager()
     
+    # Fields recorded in blockchain data (see apps.blockchain.utils.serialize_model_data)
+    # The password hash is deliberately left out of the permanent record
+    BLOCKCHAIN_FIELDS = (
+        'username', 'email', 'title', 'first_name', 'middle_name', 'last_name',
+        'registration_number', 'phone_number', 'phone_number_deleted_original',
+        'school', 'programme', 'profile_picture', 'is_active', 'is_staff', 'is_superuser',
+        'is_verified', 'is_approved', 'approved_date', 'approved_by', 'password_changed',
+        'date_joined', 'date_created', 'last_login', 'last_login_date',
+        'is_deleted', 'deleted_date', 'deleted_by',
+    )
+    
     class Meta:
         db_table = 'users'
         ordering = ['-date_created']
     
     def __str__(self):
         title_display = f"{self.get_title_display()} " if self.title else ""
-        roles = ', '.join(self.get_all_roles()) if self.get_all_roles() else 'No Role'
+        roles = ', '.join(self.get_all_roles()) or 'No Role'
         return f"{title_display}{self.get_full_name()} - {roles}"
     
     def get_full_name_with_title(self):
@@ -58,6 +58,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'apps.users.middleware.AuditLoggingMiddleware',  # Audit logging middleware
+    'apps.blockchain.middleware.BlockchainBatchMiddleware',  # One blockchain append per request
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -242,6 +243,17 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 
+# Shared cache on the Redis server Celery already uses (its own database), so
+# every web and worker process sees the same entries. The blockchain chain tip
+# cache relies on this: with per-process caches each worker's tip goes stale
+# whenever another process appends a block.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': config('CACHE_URL', default='redis://localhost:6379/1'),
+    }
+}
+
 
 # Celery beat schedule: run reminders every minute to pick up presentations
 from celery.schedules import schedule
@@ -264,6 +276,8 @@ CELERY_BEAT_SCHEDULE['send-presentation-reminders-30min'] = {
 # Blockchain Configuration
 BLOCKCHAIN_NETWORK = config('BLOCKCHAIN_NETWORK', default='http://127.0.0.1:8545')
 BLOCKCHAIN_CONTRACT_ADDRESS = config('BLOCKCHAIN_CONTRACT_ADDRESS', default='')
+# Append blockchain records from a Celery worker instead of the request thread
+BLOCKCHAIN_ASYNC_RECORDING = config('BLOCKCHAIN_ASYNC_RECORDING', default=True, cast=bool)
 
 # Email Configuration
 EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
@@ -273,6 +287,8 @@ EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
 EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('EMAIL_HOST_USER', default='carmelnkeshimana2020@gmail.com')
+# Send assignment emails from a Celery worker instead of the request thread
+NOTIFICATION_ASYNC_EMAIL = config('NOTIFICATION_ASYNC_EMAIL', default=True, cast=bool)
 
 # Custom User Model
 AUTH_USER_MODEL = 'users.CustomUser'
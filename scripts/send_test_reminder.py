@@ -7,19 +7,20 @@
 import os
 
 from apps.presentations.models import PresentationRequest
-from apps.notifications.utils import send_presentation_time_reminder
+from apps.notifications.utils import send_presentation_time_reminder, with_reminder_relations
 
 pid = os.environ.get('PRESENTATION_ID')
 minutes = int(os.environ.get('MINUTES', '1'))
 
+presentations = with_reminder_relations(PresentationRequest.objects)
 if pid:
     try:
-        p = PresentationRequest.objects.get(id=pid)
+        p = presentations.get(id=pid)
     except PresentationRequest.DoesNotExist:
         print(f"No presentation found with id {pid}")
         p = None
 else:
-    p = PresentationRequest.objects.order_by('-created_at').first()
+    p = presentations.order_by('-created_at').first()
 
 if not p:
     print('No presentation found; exiting.')